@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from wood_framer import floor_plan
+
+
+def _write_json(tmp_path, walls):
+    path = tmp_path / "plan.json"
+    path.write_text(walls if isinstance(walls, str) else json.dumps(walls))
+    return str(path)
+
+
+def _write_csv(tmp_path, text):
+    path = tmp_path / "plan.csv"
+    path.write_text(text)
+    return str(path)
+
+
+def test_load_json_walls(tmp_path):
+    path = _write_json(
+        tmp_path,
+        [{"start": [0, 0], "end": [0, 120], "height": 96, "lumber": "2x6"}],
+    )
+
+    (segment,) = floor_plan.load(path)
+
+    assert segment.length == 120
+    assert segment.h == 90
+    assert (segment.stud_width, segment.stud_height) == (2, 6)
+
+
+def test_load_csv_walls(tmp_path):
+    path = _write_csv(
+        tmp_path,
+        "start_x,start_y,end_x,end_y,height,lumber\n0,0,96,0,96,2x4\n",
+    )
+
+    (segment,) = floor_plan.load(path)
+
+    assert segment.length == 96
+    assert segment.frame_type == "wall_frame"
+
+
+def test_malformed_json_body(tmp_path):
+    path = _write_json(tmp_path, '[{"start": [0, 0],')
+
+    with pytest.raises(floor_plan.FloorPlanError, match="plan.json"):
+        floor_plan.load(path)
+
+
+def test_json_body_that_is_not_a_list(tmp_path):
+    path = _write_json(tmp_path, {"start": [0, 0]})
+
+    with pytest.raises(floor_plan.FloorPlanError, match="list of walls"):
+        floor_plan.load(path)
+
+
+@pytest.mark.parametrize("point", ["start", "end"])
+def test_short_point(tmp_path, point):
+    wall = {"start": [0, 0], "end": [96, 0], "height": 96}
+    wall[point] = [5]
+    path = _write_json(tmp_path, [wall, wall])
+
+    with pytest.raises(floor_plan.FloorPlanError, match=f"entry 0: {point} must"):
+        floor_plan.load(path)
+
+
+def test_wall_that_is_not_an_object(tmp_path):
+    path = _write_json(
+        tmp_path, [{"start": [0, 0], "end": [96, 0], "height": 96}, [0, 0]]
+    )
+
+    with pytest.raises(floor_plan.FloorPlanError, match="entry 1: expected an object"):
+        floor_plan.load(path)
+
+
+@pytest.mark.parametrize("lumber", [24, ["2", "4"], True])
+def test_non_string_lumber(tmp_path, lumber):
+    path = _write_json(
+        tmp_path,
+        [{"start": [0, 0], "end": [96, 0], "height": 96, "lumber": lumber}],
+    )
+
+    with pytest.raises(floor_plan.FloorPlanError, match="entry 0: lumber must"):
+        floor_plan.load(path)
+
+
+def test_bad_csv_row_names_its_line(tmp_path):
+    path = _write_csv(
+        tmp_path,
+        "start_x,start_y,end_x,end_y,height\n0,0,96,0,96\n0,0,96,0,tall\n",
+    )
+
+    with pytest.raises(floor_plan.FloorPlanError, match="line 3: height must"):
+        floor_plan.load(path)
+
+
+def test_unknown_frame_type(tmp_path):
+    path = _write_json(
+        tmp_path,
+        [{"start": [0, 0], "end": [96, 0], "height": 96, "frame_type": "garage"}],
+    )
+
+    with pytest.raises(floor_plan.FloorPlanError, match="Unknown frame type"):
+        floor_plan.load(path)
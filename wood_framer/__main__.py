@@ -1,4 +1,192 @@
+import argparse
+import json
+import sys
+
+from . import (
+    input_replay,
+    materials,
+    memory_report,
+    picking_benchmark,
+    pipeline_benchmark,
+    project_diff,
+    publish,
+    thumbnails,
+    viewer,
+)
 from .main import main
 
 if __name__ == "__main__":
-    main(False)
+    parser = argparse.ArgumentParser(prog="wood_framer")
+    parser.add_argument(
+        "--floor-plan",
+        help="CSV or JSON list of wall segments to import after loading the project",
+    )
+    parser.add_argument(
+        "--page-radius",
+        type=float,
+        help="only keep frames within this many inches of the camera in the scene",
+    )
+    parser.add_argument(
+        "--batch-materials",
+        metavar="PROJECTS",
+        help="directory or glob of project files to total up without opening the editor",
+    )
+    parser.add_argument(
+        "--output",
+        default="materials",
+        help="path prefix for the batch materials .txt, .csv and .json reports",
+    )
+    parser.add_argument(
+        "--thumbnails",
+        metavar="PROJECTS",
+        help="directory or glob of project files to render to PNG without a window",
+    )
+    parser.add_argument(
+        "--thumbnail-directory",
+        default="thumbnails",
+        help="directory the rendered PNG files are written to",
+    )
+    parser.add_argument(
+        "--views",
+        default=",".join(thumbnails.VIEWS),
+        help="comma separated views to render: isometric, elevations",
+    )
+    parser.add_argument(
+        "--size", default="800x600", help="rendered image size as WIDTHxHEIGHT"
+    )
+    parser.add_argument(
+        "--record-input",
+        metavar="FILE",
+        help="record the session's input events and mouse positions to FILE",
+    )
+    parser.add_argument(
+        "--replay-input",
+        metavar="FILE",
+        help="replay a recorded session offscreen and report per-tick latency",
+    )
+    parser.add_argument(
+        "--load-display",
+        help="Panda3D display module for offscreen replay, e.g. p3headlessgl",
+    )
+    parser.add_argument(
+        "--max-p99-ms",
+        type=float,
+        help="exit with an error when the replayed p99 tick latency exceeds this",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="run a Python script against the project once it has loaded",
+    )
+    parser.add_argument(
+        "--threaded-pipeline",
+        action="store_true",
+        help="run cull and draw on their own threads (threading-model Cull/Draw)",
+    )
+    parser.add_argument(
+        "--benchmark-pipeline",
+        metavar="PROJECT",
+        help="report offscreen frame times for PROJECT with and without threading",
+    )
+    parser.add_argument(
+        "--picking",
+        choices=picking_benchmark.BACKENDS,
+        default="bullet",
+        help="pick frames with Bullet ray tests or by reading back a colour ID buffer",
+    )
+    parser.add_argument(
+        "--benchmark-picking",
+        metavar="PROJECT",
+        help="report per-pick and per-frame times for PROJECT with each backend",
+    )
+    parser.add_argument(
+        "--memory-report",
+        metavar="PROJECT",
+        help="load PROJECT offscreen and print its memory use by frame type",
+    )
+    parser.add_argument(
+        "--diff",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="report frames added, removed, moved and resized between two projects"
+        " and the change in materials",
+    )
+    parser.add_argument(
+        "--publish",
+        nargs=2,
+        metavar=("PROJECT", "SCENE"),
+        help="compile PROJECT into a single flattened BAM SCENE for the viewer",
+    )
+    parser.add_argument(
+        "--view",
+        metavar="SCENE",
+        help="open a published BAM SCENE read-only",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="sample the editor from startup and write collapsed stacks to FILE on"
+        " exit (shift-p toggles sampling while running)",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=300,
+        help="number of frames to render for --benchmark-pipeline/--benchmark-picking",
+    )
+    parser.add_argument(
+        "--jobs", type=int, help="number of worker processes for batch commands"
+    )
+    arguments = parser.parse_args()
+
+    if arguments.batch_materials is not None:
+        materials.run_batch(arguments.batch_materials, arguments.output, arguments.jobs)
+    elif arguments.thumbnails is not None:
+        width, height = arguments.size.lower().split("x")
+        thumbnails.render_projects(
+            materials.find_projects(arguments.thumbnails),
+            arguments.thumbnail_directory,
+            arguments.views.split(","),
+            (int(width), int(height)),
+            arguments.jobs,
+        )
+    elif arguments.replay_input is not None:
+        report = input_replay.replay(arguments.replay_input, arguments.load_display)
+        print(json.dumps(report, indent=2))
+        if arguments.max_p99_ms is not None and report["p99_ms"] > arguments.max_p99_ms:
+            sys.exit(1)
+    elif arguments.benchmark_pipeline is not None:
+        reports = pipeline_benchmark.run(
+            arguments.benchmark_pipeline,
+            arguments.frames,
+            load_display=arguments.load_display,
+        )
+        print(json.dumps(reports, indent=2))
+    elif arguments.benchmark_picking is not None:
+        picking_reports = picking_benchmark.run(
+            arguments.benchmark_picking,
+            arguments.frames,
+            load_display=arguments.load_display,
+        )
+        print(json.dumps(picking_reports, indent=2))
+    elif arguments.diff is not None:
+        project_diff.write_report(sys.stdout, project_diff.diff_files(*arguments.diff))
+    elif arguments.publish is not None:
+        publish.publish(*arguments.publish)
+    elif arguments.view is not None:
+        viewer.view(arguments.view)
+    elif arguments.memory_report is not None:
+        memory_report.run(
+            arguments.memory_report, sys.stdout, load_display=arguments.load_display
+        )
+    else:
+        main(
+            False,
+            arguments.floor_plan,
+            arguments.page_radius,
+            arguments.record_input,
+            "Cull/Draw" if arguments.threaded_pipeline else None,
+            arguments.script,
+            arguments.picking,
+            arguments.profile,
+        )
@@ -1,23 +1,32 @@
-import json
+import functools
 import os.path
 import typing
 import uuid
-from collections import defaultdict
 
 from direct.gui import DirectGui, DirectGuiBase
 from direct.showbase.ShowBase import ShowBase
 from panda3d import bullet, core
 
 from . import (
-    door_frame,
+    autosave,
+    color_picker,
+    floor_plan,
     frame,
+    frame_builder,
     frame_display,
     frame_modifier,
+    frame_pager,
+    frame_registry,
+    frame_store,
     highlighter,
-    roof_frame,
-    stud,
-    wall_frame,
-    wall_frame_with_plywood,
+    input_recorder,
+    materials,
+    memory_report,
+    project_file,
+    project_watcher,
+    sampling_profiler,
+    scene_sync,
+    scripting,
 )
 
 
@@ -30,19 +39,67 @@ class App(ShowBase):
     _TWELVE_FEET = 12 * _INCHES_TO_FEET
     _TICK_RATE = 1 / 35
     _PROJECT_PATH = "project.json"
-
-    def __init__(self, debug_gui: bool):
+    _PROFILE_PATH = "profile.collapsed"
+    _AUTOSAVE_DIRECTORY = "autosave"
+    _AUTOSAVE_RATE = 60
+    _GEOMETRY_CACHE_DIRECTORY = "geometry_cache"
+    _PAGE_RATE = 0.5
+    _WATCH_RATE = 0.25
+    _SCENE_SYNC_SORT = 48
+    _REBUILD_SORT = 49
+    _REBUILD_BUDGET = 0.01
+    _ARRAY_COUNT = 8
+    _ARRAY_SPACING = 16
+    _BILL_RATE = 0.1
+    _FLOOR_PLAN_PATHS = ["floor_plan.json", "floor_plan.csv"]
+    _LAYER_KEYS = {
+        "1": "wall_frame",
+        "2": "wall_frame_with_ply_wood",
+        "3": "door_frame",
+        "4": "roof_frame",
+    }
+
+    def __init__(
+        self,
+        debug_gui: bool,
+        floor_plan_path: typing.Optional[str] = None,
+        page_radius: typing.Optional[float] = None,
+        project_path: typing.Optional[str] = None,
+        record_input_path: typing.Optional[str] = None,
+        mouse_watcher: typing.Optional[core.MouseWatcher] = None,
+        threading_model: typing.Optional[str] = None,
+        script_path: typing.Optional[str] = None,
+        picking: str = "bullet",
+        profile_path: typing.Optional[str] = None,
+        autosave_directory: typing.Optional[str] = None,
+        geometry_cache_directory: typing.Optional[str] = None,
+    ):
+        if threading_model is not None:
+            core.load_prc_file_data("", f"threading-model {threading_model}")
         super().__init__()
 
+        self._project_path = project_path or self._PROJECT_PATH
+        if mouse_watcher is None:
+            mouse_watcher = self.mouseWatcherNode
+
         self._global_clock: core.ClockObject = globalClock
         self._debugging_gui = debug_gui
 
+        self._profile_path = profile_path or self._PROFILE_PATH
+        self._profiler = sampling_profiler.SamplingProfiler()
+        self._profile_start_frame = 0
+        if profile_path is not None:
+            self._toggle_profiler()
+            self.exitFunc = self._stop_profiler
+
         light_node_path = self.render.attach_new_node(core.DirectionalLight("light"))
         self.render.set_light(light_node_path)
 
         self._collision_world = bullet.BulletWorld()
         self._setup_bullet_debug()
 
+        self._frame_registry = frame_registry.FrameRegistry(frame_store.FrameStore())
+
         main_light = core.AmbientLight("light2")
         main_light.set_color(core.Vec4(0.5, 0.5, 0.5, 1))
         light_node_path = self.render.attach_new_node(main_light)
@@ -51,25 +108,42 @@ class App(ShowBase):
         self._scene: core.NodePath = self.render.attach_new_node("scene")
         self._scene.set_scale(self._METRES_TO_INCHES)
 
-        self._frame_base: core.NodePath = self._scene.attach_new_node("frame_base")
-        box: core.NodePath = self.loader.load_model("box")
-        box.reparent_to(self._frame_base)
-        box.set_pos(-0.5, -0.5, 0)
-
-        if os.path.exists("wood.jpg"):
-            wood_texture: core.Texture = self.loader.load_texture("wood.jpg")
-            self._frame_base.set_texture(wood_texture, 1)
-        else:
-            self._frame_base.set_color(205 / 255, 133 / 255, 63 / 255)
-            self._frame_base.set_texture_off(1)
-        self._frame_base.hide()
+        self._frame_builder = frame_builder.FrameBuilder(
+            self.loader,
+            self._scene,
+            self._collision_world,
+            self._frame_registry,
+            geometry_cache_directory or self._GEOMETRY_CACHE_DIRECTORY,
+            self._REBUILD_BUDGET,
+        )
+        self._frame_pager: typing.Optional[frame_pager.FramePager] = None
+        if page_radius is not None:
+            self._frame_pager = frame_pager.FramePager(
+                self._frame_registry,
+                page_radius,
+                self._frame_builder.build_from_record,
+                self._page_out_frame,
+                self._frame_builder.bill,
+            )
+        self._autosave = autosave.Autosave(
+            autosave_directory or self._AUTOSAVE_DIRECTORY,
+            self._frame_registry.store,
+            self._paged_out_records,
+        )
 
+        self._picker: typing.Optional[color_picker.ColorPicker] = None
+        if picking == "color":
+            self._picker = color_picker.ColorPicker(
+                self.win, self.camera, self.camLens, self._scene, self._frame_registry
+            )
         self._highlighter = highlighter.Highlighter(
             self.render,
-            self.mouseWatcherNode,
+            mouse_watcher,
             self.camLens,
             self.camera,
             self._collision_world,
+            self._frame_builder.layers,
+            self._picker,
         )
         self._frame_modifier = frame_modifier.FrameModifier(
             self._scene,
@@ -79,12 +153,33 @@ class App(ShowBase):
             self.disable_mouse,
         )
 
+        self.task_mgr.add(scene_sync.flush, "scene_sync", sort=self._SCENE_SYNC_SORT)
+        self.task_mgr.add(
+            self._frame_builder.rebuild_queue.run,
+            "rebuild_frames",
+            sort=self._REBUILD_SORT,
+        )
         self.task_mgr.do_method_later(self._TICK_RATE, self._tick, "tick")
+        self.task_mgr.do_method_later(
+            self._AUTOSAVE_RATE, self._run_autosave, "autosave"
+        )
+        if self._frame_pager is not None:
+            self.task_mgr.do_method_later(
+                self._PAGE_RATE, self._page_frames, "page_frames"
+            )
 
         self.accept("shift-a", self._add_frame)
         self.accept("shift-d", self._copy_frame)
+        self.accept("shift-r", self._array_frame)
+        self.accept("`", self._toggle_console)
+        self.accept("shift-m", self._dump_memory)
+        self.accept("shift-b", self._toggle_bill)
+        self.accept("shift-p", self._toggle_profiler)
         self.accept("shift-s", self._save_work)
         self.accept("delete", self._delete_frame)
+        self.accept("shift-i", self._import_floor_plan)
+        for key, layer in self._LAYER_KEYS.items():
+            self.accept(key, self._toggle_layer, [layer])
 
         self._debug_gui(
             DirectGui.DirectButton(
@@ -177,51 +272,170 @@ class App(ShowBase):
             )
         )
 
-        self._load_work()
+        self._project_watcher = project_watcher.ProjectWatcher(self._project_path)
+        self.task_mgr.do_method_later(
+            self._WATCH_RATE, self._watch_project, "watch_project"
+        )
+
+        self._bill_text: typing.Optional[DirectGui.OnscreenText] = None
+        self._bill_revision = -1
+        self.task_mgr.do_method_later(self._BILL_RATE, self._update_bill, "bill")
+
+        self._console_entry: typing.Optional[DirectGui.DirectEntry] = None
+        self._console = scripting.Console(
+            {
+                "app": self,
+                "registry": self._frame_registry,
+                "builder": self._frame_builder,
+                "transaction": self.transaction,
+            }
+        )
+
+        self._input_recorder: typing.Optional[input_recorder.InputRecorder] = None
+        self._load_work(
+            functools.partial(
+                self._start_session,
+                floor_plan_path,
+                script_path,
+                record_input_path,
+                mouse_watcher,
+            )
+        )
+
+    @property
+    def scene(self):
+        return self._scene
+
+    @property
+    def frame_registry(self):
+        return self._frame_registry
+
+    @property
+    def highlighter(self):
+        return self._highlighter
+
+    def transaction(self):
+        return scripting.Transaction(
+            self._frame_registry, self._create_records, self._page_out_frame
+        )
+
+    def _create_from_record(self, details: project_file.Record):
+        if self._frame_pager is None:
+            return self._frame_builder.build_from_record(details)
+        self._frame_pager.add(details)
+
+    def _create_records(
+        self, records: typing.List[project_file.Record]
+    ) -> typing.List[frame.Frame]:
+        if self._frame_pager is None:
+            return self._frame_builder.build_records(records)
+
+        for details in records:
+            self._frame_pager.add(details)
+        self._frame_pager.update(self._viewer_position())
+        return []
+
+    def _toggle_console(self):
+        if self.buttonThrowers is None:
+            return
+
+        if self._console_entry is not None:
+            self._console_entry.destroy()
+            self._console_entry = None
+            self.buttonThrowers[0].node().set_prefix("")
+            return
+
+        self._console_entry = DirectGui.DirectEntry(
+            parent=self.a2dBottomLeft,
+            command=self._run_console_line,
+            focus=1,
+            width=40,
+            scale=0.05,
+            pos=core.Point3(0.05, 0, 0.05),
+        )
+        self.buttonThrowers[0].node().set_prefix("console-")
+        self.accept("console-`", self._toggle_console)
+
+    def _run_console_line(self, line: str):
+        self._console.push(line)
+        assert self._console_entry is not None
+        self._console_entry.enterText("")
+        self._console_entry["focus"] = 1
+
+    def _toggle_bill(self):
+        if self._bill_text is not None:
+            self._bill_text.destroy()
+            self._bill_text = None
+            return
+
+        self._bill_text = DirectGui.OnscreenText(
+            parent=self.a2dTopLeft,
+            align=core.TextNode.A_left,
+            scale=0.05,
+            fg=core.Vec4(1, 1, 1, 1),
+            shadow=core.Vec4(0, 0, 0, 1),
+            pos=core.Point2(0.05, -0.1),
+            mayChange=True,
+        )
+        self._bill_revision = -1
+
+    def _update_bill(self, task):
+        bill = self._frame_builder.bill
+        if self._bill_text is not None and bill.revision != self._bill_revision:
+            self._bill_text.setText(bill.describe())
+            self._bill_revision = bill.revision
+        return task.again
 
     def _dump_materials(self):
-        with open("materials.txt", "w+") as file:
-            total_lumber: typing.Dict[str, float] = defaultdict(lambda: 0.0)
+        frame_cuts = [frame_to_check.cuts for frame_to_check in self._frame_registry]
+        frame_cuts += [
+            materials.record_cuts(record) for record in self._paged_out_records()
+        ]
+        frame_panels = [
+            frame_to_check.panels for frame_to_check in self._frame_registry
+        ]
+        frame_panels += [
+            materials.record_panels(record) for record in self._paged_out_records()
+        ]
 
-            all_frames: typing.List[core.NodePath] = self._scene.find_all_matches(
-                "**/frame-*"
+        with open("materials.txt", "w+") as file:
+            materials.write_report(file, frame_cuts, frame_panels)
+
+    def _dump_memory(self):
+        with open("memory.txt", "w+") as file:
+            memory_report.write_report(
+                file,
+                memory_report.collect(self._frame_registry),
+                memory_report.python_allocations(),
             )
-            for index, frame_to_calculate in enumerate(all_frames):
-
-                cuts: typing.List[typing.Tuple(str, float)] = []
-                lumber: typing.Dict[str, float] = defaultdict(lambda: 0.0)
-                all_studs: typing.List[
-                    core.NodePath
-                ] = frame_to_calculate.find_all_matches("**/stud-*")
-                for stud_node_path in all_studs:
-                    display: core.NodePath = stud_node_path.find("display")
-                    lumber_type = f'{display.get_sx()}"x{display.get_sy()}"'
-                    length: float = stud_node_path.get_sz()
-                    lumber[lumber_type] += length
-                    total_lumber[lumber_type] += length
-                    cuts.append((lumber_type, length))
-
-                if len(lumber) > 0:
-                    file.write(f"Frame {index}:\n")
-                    file.write("\tLumber:\n")
-                    for lumber_type, length in lumber.items():
-                        file.write(
-                            f"\t\t{lumber_type}: {stud.inches_to_nice_length(length)}\n"
-                        )
-
-                    file.write("\tCuts:\n")
-                    for lumber_type, length in cuts:
-                        file.write(
-                            f"\t\t{lumber_type}: {stud.inches_to_nice_length(length)}\n"
-                        )
-
-            file.write("Total:\n")
-            for lumber_type, length in total_lumber.items():
-                file.write(f"\t{lumber_type}: {stud.inches_to_nice_length(length)}\n")
-                for lumber_type, length in lumber.items():
-                    file.write(
-                        f"\t{lumber_type}: {stud.inches_to_nice_length(length)}\n"
-                    )
+
+    def _toggle_profiler(self):
+        if self._profiler.running:
+            self._stop_profiler()
+            return
+
+        self._profile_start_frame = self._global_clock.get_frame_count()
+        self._profiler.start()
+
+    def _stop_profiler(self):
+        if not self._profiler.running:
+            return
+
+        self._profiler.stop()
+        self._profiler.write(
+            self._profile_path,
+            {
+                "frames": len(self._frame_registry),
+                "paged_out": len(self._paged_out_records()),
+                "studs": sum(
+                    lumber_totals["cuts"]
+                    for lumber_totals in self._frame_builder.bill.totals().values()
+                    if "sheets" not in lumber_totals
+                ),
+                "rendered_frames": self._global_clock.get_frame_count()
+                - self._profile_start_frame,
+            },
+        )
 
     def _delete_frame(self):
         if self._highlighter.selected_frame is None:
@@ -231,6 +445,13 @@ class App(ShowBase):
         self._highlighter.clear()
         frame_to_change.destroy()
 
+    def _toggle_layer(self, layer: str):
+        if self._frame_builder.layers.toggle(layer):
+            return
+
+        for hidden_frame in self._frame_registry.by_type(layer):
+            self._highlighter.forget(hidden_frame)
+
     def _change_frame_to_wall(self):
         if self._highlighter.selected_frame is None:
             return
@@ -241,7 +462,7 @@ class App(ShowBase):
             frame_to_change.stud_height,
             frame_to_change.length,
             frame_to_change.height,
-            wall_frame.Display,
+            frame_display.get_klass("wall_frame"),
         )
 
     def _change_frame_to_wall_with_ply_wood(self):
@@ -254,7 +475,7 @@ class App(ShowBase):
             frame_to_change.stud_height,
             frame_to_change.length,
             frame_to_change.height,
-            wall_frame_with_plywood.Display,
+            frame_display.get_klass("wall_frame_with_ply_wood"),
         )
 
     def _change_frame_to_door(self):
@@ -267,7 +488,7 @@ class App(ShowBase):
             frame_to_change.stud_height,
             frame_to_change.length,
             frame_to_change.height,
-            door_frame.Display,
+            frame_display.get_klass("door_frame"),
         )
 
     def _change_frame_to_roof(self):
@@ -280,7 +501,7 @@ class App(ShowBase):
             frame_to_change.stud_height,
             frame_to_change.length,
             frame_to_change.height,
-            roof_frame.Display,
+            frame_display.get_klass("roof_frame"),
         )
 
     def _debug_gui(self, component: DirectGuiBase.DirectGuiWidget):
@@ -334,67 +555,174 @@ class App(ShowBase):
             frame_to_change.display_klass,
         )
 
-    def _load_work(self):
-        if not os.path.isfile(self._PROJECT_PATH):
+    def _start_session(
+        self,
+        floor_plan_path: typing.Optional[str],
+        script_path: typing.Optional[str],
+        record_input_path: typing.Optional[str],
+        mouse_watcher: core.MouseWatcher,
+    ):
+        if floor_plan_path is not None:
+            self._import_floor_plan(floor_plan_path)
+        if script_path is not None:
+            self._console.run_file(script_path)
+
+        if record_input_path is not None:
+            self._input_recorder = input_recorder.InputRecorder(
+                record_input_path,
+                self.messenger,
+                self.task_mgr,
+                mouse_watcher,
+                self.camera,
+                (self.win.get_x_size(), self.win.get_y_size()),
+                self._TICK_RATE,
+                self._frame_registry.store.records() + self._paged_out_records(),
+            )
+
+    def _load_work(self, loaded: typing.Callable[[], None]):
+        recovery_path = self._autosave.newer_than(self._project_path)
+        if recovery_path is None:
+            self._load_project(self._project_path)
+            loaded()
             return
+        newer_path = recovery_path
+
+        def _recover(recover: bool):
+            dialog.cleanup()
+            if recover:
+                self._load_project(newer_path)
+            else:
+                self._autosave.discard()
+                self._load_project(self._project_path)
+            loaded()
+
+        dialog = DirectGui.YesNoDialog(
+            text="Recover unsaved work from the last autosave?",
+            command=_recover,
+        )
 
-        with open(self._PROJECT_PATH, "r") as file:
-            result: typing.List[typing.Dict[str, float]] = json.load(file)
+    def _load_project(self, path: str):
+        if not os.path.isfile(path):
+            return
 
-        for details in result:
-            new_frame = self._build_wall_frame(
-                details["stud_width"],
-                details["stud_height"],
-                details["length"],
-                details["height"],
-                frame_display.get_klass(details["frame_type"]),
-            )
-            new_frame.set_position(details["x"], details["y"], details["z"])
-            new_frame.set_rotation(details["h"], details["p"], details["r"])
+        result: typing.List[typing.Dict[str, float]] = project_file.read(path)
+
+        self._create_records(result)
+
+        self._autosave.mark_saved()
+
+    def _watch_project(self, task):
+        records = self._project_watcher.changed_records()
+        if records is None:
+            return task.again
+
+        if self._frame_pager is not None:
+            self._frame_pager.clear()
+
+        project_watcher.apply(
+            self._frame_registry,
+            records,
+            self._create_from_record,
+            self._page_out_frame,
+        )
+        if self._frame_pager is not None:
+            self._frame_pager.update(self._viewer_position())
+        self._autosave.mark_saved()
+        return task.again
+
+    def _page_out_frame(self, frame_to_page_out: frame.Frame):
+        self._highlighter.forget(frame_to_page_out)
+        frame_to_page_out.destroy()
+
+    def _paged_out_records(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        if self._frame_pager is None:
+            return []
+        return self._frame_pager.records()
+
+    def _page_frames(self, task):
+        self._frame_pager.update(self._viewer_position())
+        return task.again
+
+    def _viewer_position(self) -> core.Point3:
+        return self._scene.get_relative_point(self.camera, core.Point3(0, 0, 0))
 
     def _save_work(self):
-        result: typing.List[typing.Dict[str, float]] = []
-        for path in self._scene.find_all_matches("frame-*"):
-            frame_to_save = frame.Frame.frame_from_node_path(path)
-            position = frame_to_save.get_position()
-            rotation = frame_to_save.get_rotation()
-            details = {
-                "frame_type": frame_to_save.display_klass.SERIALIZED_NAME,
-                "stud_width": frame_to_save.stud_width,
-                "stud_height": frame_to_save.stud_height,
-                "length": frame_to_save.length,
-                "height": frame_to_save.height,
-                "x": position.x,
-                "y": position.y,
-                "z": position.z,
-                "h": rotation.x,
-                "p": rotation.y,
-                "r": rotation.z,
-            }
-            result.append(details)
+        result: typing.List[typing.Dict[str, float]] = (
+            self._frame_registry.store.records() + self._paged_out_records()
+        )
+
+        project_file.write(self._project_path, result)
+        self._autosave.mark_saved()
+        self._project_watcher.mark_current()
 
-        with open(self._PROJECT_PATH, "w+") as file:
-            json.dump(result, file)
+    def _run_autosave(self, task):
+        self._autosave.save()
+        return task.again
+
+    def _import_floor_plan(self, path: typing.Optional[str] = None):
+        if path is None:
+            path = next(
+                (
+                    candidate
+                    for candidate in self._FLOOR_PLAN_PATHS
+                    if os.path.isfile(candidate)
+                ),
+                None,
+            )
+            if path is None:
+                return
+
+        try:
+            segments = floor_plan.load(path)
+        except (OSError, floor_plan.FloorPlanError) as error:
+            self._show_error(f"Could not import the floor plan:\n{error}")
+            return
+
+        self._create_records([segment.record() for segment in segments])
+
+    def _show_error(self, message: str):
+        def _close(_):
+            dialog.cleanup()
+
+        dialog = DirectGui.OkDialog(text=message, command=_close)
 
     def _add_frame(self):
-        self._build_wall_frame(2, 4, 32, self._EIGHT_FEET, wall_frame.Display)
+        self._frame_builder.build(
+            2, 4, 32, self._EIGHT_FEET, frame_display.get_klass("wall_frame")
+        )
 
     def _copy_frame(self):
         if self._highlighter.selected_frame is None:
             return
 
+        record = self._frame_registry.store.record(self._highlighter.selected_frame.id)
+        del record["uid"]
+        self._frame_builder.build_records([record])
+
+    def _array_frame(self):
+        if self._highlighter.selected_frame is None:
+            return
+
         old_frame = self._highlighter.selected_frame
-        new_frame = self._build_wall_frame(
-            old_frame.stud_width,
-            old_frame.stud_height,
-            old_frame.length,
-            old_frame.height,
-            old_frame.display_klass,
-        )
-        new_frame.set_position(old_frame.get_position())
-        new_frame.set_rotation(old_frame.get_rotation())
+        rotation = core.Quat()
+        rotation.set_hpr(old_frame.get_rotation())
+        offset = rotation.xform(core.Vec3(0, self._ARRAY_SPACING, 0))
+        if self._frame_pager is None:
+            self._frame_builder.build_array(old_frame, self._ARRAY_COUNT, offset)
+            return
+
+        record = self._frame_registry.store.record(old_frame.id)
+        del record["uid"]
+        copies: typing.List[project_file.Record] = []
+        for index in range(1, self._ARRAY_COUNT + 1):
+            position = old_frame.get_position() + offset * index
+            copies.append({**record, "x": position.x, "y": position.y, "z": position.z})
+        self._create_records(copies)
 
     def _re_enable_mouse(self):
+        if self.mouseInterfaceNode is None:
+            return
+
         camera: core.NodePath = self.camera
         inverse_camera_transform = core.Mat4(camera.get_mat())
         inverse_camera_transform.invertInPlace()
@@ -419,44 +747,3 @@ class App(ShowBase):
         debug.show()
 
         self._collision_world.set_debug_node(debug_node)
-
-    def _build_wall_frame(
-        self,
-        stud_width: float,
-        stud_height: float,
-        length: float,
-        height: float,
-        display_klass: typing.Type[frame_display.FrameDisplay],
-    ):
-        return frame.Frame(
-            self._scene,
-            self._collision_world,
-            stud_width,
-            stud_height,
-            length,
-            height,
-            self._new_stud,
-            display_klass,
-        )
-
-    def _new_stud(
-        self, parent: core.NodePath, width: float, height: float, length: float
-    ):
-        result = self._new_frame_piece(parent)
-        display: core.NodePath = result.attach_new_node("display")
-        self._copy(self._frame_base, display)
-        display.set_scale(width, height, 1)
-
-        result.set_sz(length)
-        return result
-
-    @staticmethod
-    def _new_frame_piece(parent: core.NodePath) -> core.NodePath:
-        piece_id = uuid.uuid4()
-        return parent.attach_new_node(f"stud-{piece_id}")
-
-    @staticmethod
-    def _copy(source: core.NodePath, destination: core.NodePath):
-        source.show()
-        source.copy_to(destination)
-        source.hide()
@@ -0,0 +1,80 @@
+import glob
+import os
+import os.path
+import threading
+import time
+import typing
+
+from . import frame_store, project_file
+
+
+class Autosave:
+    _FILE_PATTERN = "project-*.json"
+    _KEEP = 3
+
+    def __init__(
+        self,
+        directory: str,
+        store: frame_store.FrameStore,
+        extra_records: typing.Callable[[], typing.List[project_file.Record]] = list,
+    ):
+        self._directory = directory
+        self._store = store
+        self._extra_records = extra_records
+        self._saved_revision = store.revision
+        self._worker: typing.Optional[threading.Thread] = None
+
+    def mark_saved(self):
+        self._saved_revision = self._store.revision
+
+    def save(self):
+        if self._store.revision == self._saved_revision:
+            return
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        snapshot = self._store.copy()
+        self._saved_revision = snapshot.revision
+        self._worker = threading.Thread(
+            target=self._write,
+            args=(snapshot, self._extra_records()),
+            name="autosave",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def discard(self):
+        for path in glob.glob(os.path.join(self._directory, self._FILE_PATTERN)):
+            os.remove(path)
+
+    def newest(self) -> typing.Optional[str]:
+        paths = glob.glob(os.path.join(self._directory, self._FILE_PATTERN))
+        if len(paths) < 1:
+            return None
+        return max(paths, key=os.path.getmtime)
+
+    def newer_than(self, path: str) -> typing.Optional[str]:
+        newest = self.newest()
+        if newest is None:
+            return None
+        if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(newest):
+            return None
+        return newest
+
+    def _write(
+        self,
+        snapshot: frame_store.FrameStore,
+        extra_records: typing.List[project_file.Record],
+    ):
+        os.makedirs(self._directory, exist_ok=True)
+        path = os.path.join(
+            self._directory, self._FILE_PATTERN.replace("*", str(time.time_ns()))
+        )
+        project_file.write(path, snapshot.records() + extra_records)
+
+        old_paths = sorted(
+            glob.glob(os.path.join(self._directory, self._FILE_PATTERN)),
+            key=os.path.getmtime,
+        )
+        for old_path in old_paths[: -self._KEEP]:
+            os.remove(old_path)
@@ -0,0 +1,124 @@
+import threading
+import typing
+from collections import Counter, defaultdict
+
+from . import materials, sheet_goods, stud
+
+Lumber = typing.Tuple[float, float]
+
+
+class BillOfMaterials:
+    def __init__(self):
+        self._lengths: typing.Dict[Lumber, float] = defaultdict(lambda: 0.0)
+        self._cuts: typing.Dict[Lumber, int] = defaultdict(lambda: 0)
+        self._pieces: typing.Counter[typing.Tuple[float, float]] = Counter()
+        self._pieces_revision = 0
+        self._sheets = 0
+        self._sheets_revision = 0
+        self._nested = (0, 0)
+        self._nesting: typing.Optional[threading.Thread] = None
+        self._revision = 0
+
+    @property
+    def revision(self):
+        self._collect_sheets()
+        return self._revision
+
+    def add(
+        self,
+        cuts: typing.Iterable[materials.Cut],
+        panels: typing.Iterable[sheet_goods.Panel] = (),
+    ):
+        self._change(cuts, panels, 1)
+
+    def remove(
+        self,
+        cuts: typing.Iterable[materials.Cut],
+        panels: typing.Iterable[sheet_goods.Panel] = (),
+    ):
+        self._change(cuts, panels, -1)
+
+    def totals(self) -> materials.Totals:
+        totals = self._lumber_totals()
+        if self._pieces:
+            if self._sheets_revision != self._pieces_revision:
+                self._sheets = sheet_goods.sheet_count(self._pieces.elements())
+                self._sheets_revision = self._pieces_revision
+            totals[sheet_goods.SHEET_NAME] = {
+                "sheets": self._sheets,
+                "cuts": sum(self._pieces.values()),
+            }
+        return totals
+
+    def describe(self):
+        lines = [
+            f"{lumber}: {stud.inches_to_nice_length(lumber_totals['length'])}"
+            f" ({lumber_totals['cuts']} cuts)"
+            for lumber, lumber_totals in self._lumber_totals().items()
+        ]
+        if self._pieces:
+            self._collect_sheets()
+            if self._sheets_revision == self._pieces_revision:
+                sheets = f"{self._sheets} sheets"
+            else:
+                sheets = "counting sheets"
+                self._start_nesting()
+            lines.append(
+                f"{sheet_goods.SHEET_NAME}: {sheets}"
+                f" ({sum(self._pieces.values())} pieces)"
+            )
+        return "\n".join(lines)
+
+    def _lumber_totals(self) -> materials.Totals:
+        return {
+            materials.lumber_type(*lumber): {
+                "length": self._lengths[lumber],
+                "cuts": count,
+            }
+            for lumber, count in sorted(self._cuts.items())
+        }
+
+    def _start_nesting(self):
+        if self._nesting is not None and self._nesting.is_alive():
+            return
+
+        self._nesting = threading.Thread(
+            target=self._nest,
+            args=(self._pieces_revision, list(self._pieces.elements())),
+            name="nesting",
+            daemon=True,
+        )
+        self._nesting.start()
+
+    def _nest(
+        self, pieces_revision: int, pieces: typing.List[typing.Tuple[float, float]]
+    ):
+        self._nested = (pieces_revision, sheet_goods.sheet_count(pieces))
+
+    def _collect_sheets(self):
+        pieces_revision, sheets = self._nested
+        if pieces_revision > self._sheets_revision:
+            self._sheets, self._sheets_revision = sheets, pieces_revision
+            self._revision += 1
+
+    def _change(
+        self,
+        cuts: typing.Iterable[materials.Cut],
+        panels: typing.Iterable[sheet_goods.Panel],
+        sign: int,
+    ):
+        for stud_width, stud_height, length in cuts:
+            lumber = (stud_width, stud_height)
+            self._cuts[lumber] += sign
+            if self._cuts[lumber] == 0:
+                del self._cuts[lumber]
+                self._lengths.pop(lumber, None)
+            else:
+                self._lengths[lumber] += length * sign
+
+        for _, _, width, height in panels:
+            self._pieces[(width, height)] += sign
+            if self._pieces[(width, height)] == 0:
+                del self._pieces[(width, height)]
+            self._pieces_revision += 1
+        self._revision += 1
@@ -0,0 +1,87 @@
+import typing
+
+from panda3d import core
+
+from . import frame, frame_registry, frame_shader
+
+
+class ColorPicker:
+    _SIZE = 1
+
+    def __init__(
+        self,
+        window: core.GraphicsOutput,
+        camera: core.NodePath,
+        lens: core.Lens,
+        scene: core.NodePath,
+        registry: frame_registry.FrameRegistry,
+    ):
+        self._window = window
+        self._main_lens = lens
+        self._registry = registry
+        self._picked_stud: typing.Optional[int] = None
+
+        properties = core.FrameBufferProperties()
+        properties.set_rgba_bits(8, 8, 8, 8)
+        properties.set_depth_bits(1)
+        self._texture = core.Texture("picker")
+        self._buffer: core.GraphicsOutput = window.make_texture_buffer(
+            "picker", self._SIZE, self._SIZE, self._texture, True, properties
+        )
+        self._buffer.set_clear_color(core.Vec4(0, 0, 0, 0))
+        self._buffer.set_sort(-100)
+
+        self._lens = lens.make_copy()
+        camera_node = core.Camera("picker", self._lens)
+        camera_node.set_scene(scene)
+
+        state = core.NodePath("picker_state")
+        state.set_shader(frame_shader.make_pick(), 100)
+        state.set_light_off(100)
+        state.set_texture_off(100)
+        state.set_transparency(core.TransparencyAttrib.M_none, 100)
+        state.set_color_scale_off(100)
+        camera_node.set_initial_state(state.get_state())
+
+        self._camera = camera.attach_new_node(camera_node)
+        display_region = self._buffer.make_display_region()
+        display_region.set_camera(self._camera)
+
+    @property
+    def picked_stud(self):
+        return self._picked_stud
+
+    def pick(self, mouse: core.Point2) -> typing.Optional[frame.Frame]:
+        picked = None
+        self._picked_stud = None
+        peeker = self._texture.peek()
+        if peeker is not None:
+            color = core.LColor()
+            peeker.fetch_pixel(color, 0, 0)
+            pick_id = frame_shader.pick_id(color)
+            if pick_id > 0:
+                picked = self._registry.get(pick_id - 1)
+                stud = frame_shader.pick_stud(color)
+                if stud > 0:
+                    self._picked_stud = stud - 1
+
+        self._aim(mouse)
+        return picked
+
+    def pick_now(self, mouse: core.Point2) -> typing.Optional[frame.Frame]:
+        self._aim(mouse)
+        self._window.get_engine().render_frame()
+        return self.pick(mouse)
+
+    def destroy(self):
+        self._camera.remove_node()
+        self._window.get_engine().remove_window(self._buffer)
+
+    def _aim(self, mouse: core.Point2):
+        film_size = self._main_lens.get_film_size()
+        self._lens.set_film_size(
+            film_size.x * self._SIZE / self._window.get_x_size(),
+            film_size.y * self._SIZE / self._window.get_y_size(),
+        )
+        self._lens.set_focal_length(self._main_lens.get_focal_length())
+        self._lens.set_film_offset(mouse.x * film_size.x / 2, mouse.y * film_size.y / 2)
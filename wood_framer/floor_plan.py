@@ -0,0 +1,124 @@
+import csv
+import json
+import math
+import os.path
+import typing
+
+from . import frame_display, project_file
+
+_DEFAULT_LUMBER = "2x4"
+_DEFAULT_FRAME_TYPE = "wall_frame"
+
+
+class FloorPlanError(ValueError):
+    pass
+
+
+class WallSegment(typing.NamedTuple):
+    frame_type: str
+    stud_width: float
+    stud_height: float
+    length: float
+    height: float
+    x: float
+    y: float
+    z: float
+    h: float
+
+    def record(self) -> project_file.Record:
+        return {**self._asdict(), "p": 0, "r": 0}
+
+
+def load(path: str) -> typing.List[WallSegment]:
+    rows: typing.List[typing.Tuple[str, typing.Any]]
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with open(path, "r", newline="") as file:
+            reader = csv.DictReader(file)
+            try:
+                rows = [(f"line {reader.line_num}", row) for row in reader]
+            except (csv.Error, ValueError) as error:
+                raise FloorPlanError(
+                    f"{path}, line {reader.line_num}: {error}"
+                ) from None
+    else:
+        with open(path, "r") as file:
+            try:
+                entries = json.load(file)
+            except ValueError as error:
+                raise FloorPlanError(f"{path}: {error}") from None
+        if not isinstance(entries, list):
+            raise FloorPlanError(f"{path}: expected a list of walls")
+        rows = [(f"entry {index}", row) for index, row in enumerate(entries)]
+
+    segments: typing.List[WallSegment] = []
+    for location, row in rows:
+        try:
+            segments.append(segment_from_row(row))
+        except (KeyError, TypeError, ValueError) as error:
+            raise FloorPlanError(f"{path}, {location}: {error.args[0]}") from None
+    return segments
+
+
+def segment_from_row(row: typing.Dict[str, typing.Any]):
+    row = _flatten_json_row(row)
+    start_x = _number(row, "start_x")
+    start_y = _number(row, "start_y")
+    end_x = _number(row, "end_x")
+    end_y = _number(row, "end_y")
+    stud_width, stud_height = parse_lumber(row.get("lumber") or _DEFAULT_LUMBER)
+    frame_type = row.get("frame_type") or _DEFAULT_FRAME_TYPE
+    frame_display.get_klass(frame_type)
+
+    delta_x = end_x - start_x
+    delta_y = end_y - start_y
+
+    return WallSegment(
+        frame_type=frame_type,
+        stud_width=stud_width,
+        stud_height=stud_height,
+        length=math.hypot(delta_x, delta_y),
+        height=_number(row, "height"),
+        x=start_x,
+        y=start_y,
+        z=_number(row, "z", 0),
+        h=math.degrees(math.atan2(delta_y, delta_x)),
+    )
+
+
+def parse_lumber(lumber: str) -> typing.Tuple[float, float]:
+    try:
+        width, height = lumber.lower().replace('"', "").split("x")
+        return float(width), float(height)
+    except (AttributeError, ValueError):
+        raise ValueError(f"lumber must look like 2x4, got {lumber!r}") from None
+
+
+def _number(
+    row: typing.Dict[str, typing.Any],
+    column: str,
+    default: typing.Optional[float] = None,
+) -> float:
+    value = row.get(column)
+    if value is None or value == "":
+        if default is None:
+            raise ValueError(f"{column} is missing")
+        return default
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{column} must be a number, got {value!r}") from None
+
+
+def _flatten_json_row(row: typing.Dict[str, typing.Any]):
+    if not isinstance(row, dict):
+        raise ValueError(f"expected an object, got {row!r}")
+
+    result = dict(row)
+    for point in ("start", "end"):
+        if point not in row:
+            continue
+        if not isinstance(row[point], (list, tuple)) or len(row[point]) < 2:
+            raise ValueError(f"{point} must be an [x, y] pair, got {row[point]!r}")
+        result[f"{point}_x"], result[f"{point}_y"] = row[point][:2]
+    return result
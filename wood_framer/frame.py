@@ -4,7 +4,18 @@ import uuid
 
 from panda3d import bullet, core
 
-from . import frame_display
+from . import (
+    bill_of_materials,
+    frame_display,
+    frame_registry,
+    frame_shader,
+    frame_store,
+    geometry_cache,
+    layers,
+    rebuild_queue,
+    scene_sync,
+    sheet_goods,
+)
 
 
 class FrameHighlight(enum.Enum):
@@ -13,36 +24,81 @@ class FrameHighlight(enum.Enum):
     selected = 2
 
 
+_HIGHLIGHT_COLORS = {
+    FrameHighlight.none: core.Vec4(1, 1, 1, 0),
+    FrameHighlight.highlighted: core.Vec4(0, 1, 0, 0.5),
+    FrameHighlight.selected: core.Vec4(0, 0, 1, 0.5),
+}
+
+
 class Frame:
+    __slots__ = (
+        "_registry",
+        "_store",
+        "_row",
+        "_world",
+        "_layers",
+        "_make_stud",
+        "_highlight",
+        "_highlight_color",
+        "_display_parent",
+        "_frame_boundry_node",
+        "_frame_boundry",
+        "_frame_display",
+        "_cuts",
+        "_panels",
+        "_geometry_cache",
+        "_shared_geometry",
+        "_rebuilds",
+        "_bill",
+        "_dirty",
+    )
+
     def __init__(
         self,
-        scene: core.NodePath,
+        frame_layers: layers.Layers,
         world: bullet.BulletWorld,
+        registry: frame_registry.FrameRegistry,
         stud_width: float,
         stud_height: float,
         length: float,
         height: float,
         make_stud: typing.Callable[[core.NodePath, float, float, float], core.NodePath],
         display_klass: typing.Type[frame_display.FrameDisplay],
+        cache: typing.Optional[geometry_cache.GeometryCache] = None,
+        source: typing.Optional["Frame"] = None,
+        rebuilds: typing.Optional[rebuild_queue.RebuildQueue] = None,
+        bill: typing.Optional[bill_of_materials.BillOfMaterials] = None,
+        row: typing.Optional[int] = None,
+        position: typing.Optional[typing.Sequence[float]] = None,
+        rotation: typing.Optional[typing.Sequence[float]] = None,
+        attach: bool = True,
     ):
+        self._registry = registry
+        self._store = registry.store
+        self._row = registry.add(self, row)
         self._world = world
-        self._stud_width = stud_width
-        self._stud_height = stud_height
-        self._length = length
-        self._height = height
-        self._display_klass = display_klass
+        self._layers = frame_layers
 
         self._make_stud = make_stud
+        self._geometry_cache = cache
+        self._rebuilds = rebuilds
+        self._bill = bill
+        self._dirty = False
         self._highlight = FrameHighlight.none
 
         frame_id = uuid.uuid4()
-        self._display_parent: core.NodePath = scene.attach_new_node(f"frame-{frame_id}")
+        self._display_parent = core.NodePath(f"frame-{frame_id}")
         self._display_parent.set_python_tag("frame", self)
 
-        self.get_position = self._display_parent.get_pos
-        self.set_position = self._display_parent.set_pos
-        self.get_rotation = self._display_parent.get_hpr
-        self.set_rotation = self._display_parent.set_hpr
+        self._highlight_color = core.PTA_LVecBase4f.empty_array(1)
+        self._highlight_color[0] = _HIGHLIGHT_COLORS[self._highlight]
+        self._display_parent.set_shader_input(
+            frame_shader.HIGHLIGHT_INPUT, self._highlight_color
+        )
+        self._display_parent.set_shader_input(
+            frame_shader.PICK_INPUT, frame_shader.pick_color(self._row + 1)
+        )
 
         frame_boundry_shape = bullet.BulletBoxShape(core.Vec3(0.5, 0.5, 0.5))
         self._frame_boundry_node = bullet.BulletRigidBodyNode(f"frame-{frame_id}")
@@ -54,19 +110,27 @@ class Frame:
         self._frame_boundry_node.set_mass(0)
         self._frame_boundry_node.set_python_tag("frame", self)
 
-        self._world.attach(self._frame_boundry_node)
+        if attach:
+            self._world.attach(self._frame_boundry_node)
         self._frame_boundry: core.NodePath = self._display_parent.attach_new_node(
             self._frame_boundry_node
         )
+        if position is not None:
+            self._display_parent.set_pos(*position)
+            self._store_vector(
+                frame_store.FrameStore.POSITION, self._display_parent.get_pos()
+            )
+        if rotation is not None:
+            self._display_parent.set_hpr(*rotation)
+            self._store_vector(
+                frame_store.FrameStore.ROTATION, self._display_parent.get_hpr()
+            )
 
         self._frame_display: typing.Optional[frame_display.FrameDisplay] = None
-        self.update(
-            self._stud_width,
-            self._stud_height,
-            self._length,
-            self._height,
-            self._display_klass,
-        )
+        self._cuts: typing.List[typing.Tuple[float, float, float]] = []
+        self._panels: typing.List[sheet_goods.Panel] = []
+        self._shared_geometry: typing.Optional[core.NodePath] = None
+        self.update(stud_width, stud_height, length, height, display_klass, source)
 
     @staticmethod
     def frame_from_node_path(path: core.NodePath):
@@ -76,40 +140,89 @@ class Frame:
     def frame_from_node(node: bullet.BulletBodyNode):
         return typing.cast(Frame, node.get_python_tag("frame"))
 
+    @property
+    def id(self):
+        return self._row
+
+    @property
+    def node_path(self):
+        return self._display_parent
+
+    @property
+    def uid(self):
+        return self._store.uid[self._row]
+
+    def set_uid(self, uid: str):
+        self._store.uid[self._row] = uid
+
     @property
     def stud_width(self):
-        return self._stud_width
+        return self._store.stud_width[self._row]
 
     @property
     def stud_height(self):
-        return self._stud_height
+        return self._store.stud_height[self._row]
 
     @property
     def length(self):
-        return self._length
+        return self._store.length[self._row]
 
     @property
     def height(self):
-        return self._height
+        return self._store.height[self._row]
 
     @property
     def display_klass(self):
-        return self._display_klass
+        return self._store.klass(self._row)
+
+    @scene_sync.mutates_scene
+    def attach(self):
+        self._world.attach(self._frame_boundry_node)
+
+    def get_position(self):
+        store, row = self._store, self._row
+        return core.Point3(store.x[row], store.y[row], store.z[row])
+
+    @scene_sync.mutates_scene
+    def set_position(self, *position):
+        self._display_parent.set_pos(*position)
+        self._store_vector(
+            frame_store.FrameStore.POSITION, self._display_parent.get_pos()
+        )
+
+    def get_rotation(self):
+        store, row = self._store, self._row
+        return core.Vec3(store.h[row], store.p[row], store.r[row])
+
+    @scene_sync.mutates_scene
+    def set_rotation(self, *rotation):
+        self._display_parent.set_hpr(*rotation)
+        self._store_vector(
+            frame_store.FrameStore.ROTATION, self._display_parent.get_hpr()
+        )
+
+    @property
+    def cuts(self):
+        if self._dirty:
+            self.rebuild()
+        return self._cuts
+
+    @property
+    def panels(self):
+        return self.display_klass.sheathing(
+            self.stud_width, self.stud_height, self.length, self.height
+        )
 
     @property
     def is_selected(self):
         return self._highlight == FrameHighlight.selected
 
+    @scene_sync.mutates_scene
     def set_highlight(self, highlight_type: FrameHighlight):
         self._highlight = highlight_type
+        self._highlight_color[0] = _HIGHLIGHT_COLORS[highlight_type]
 
-        if self._highlight == FrameHighlight.highlighted:
-            self._display_parent.set_color(0, 1, 0, 1)
-        elif self._highlight == FrameHighlight.selected:
-            self._display_parent.set_color(0, 0, 1, 1)
-        else:
-            self._display_parent.set_color(1, 1, 1, 1)
-
+    @scene_sync.mutates_scene
     def update(
         self,
         stud_width: float,
@@ -117,27 +230,110 @@ class Frame:
         length: float,
         height: float,
         display_klass: typing.Type[frame_display.FrameDisplay],
+        source: typing.Optional["Frame"] = None,
     ):
+        store, row = self._store, self._row
+        store.type_id[row] = store.type_id_for(display_klass)
+        store.stud_width[row] = stud_width
+        store.stud_height[row] = stud_height
+        store.length[row] = length
+        store.height[row] = height
+        store.revision += 1
+        self._registry.reindex(self)
+        self._layers.place(
+            self._display_parent,
+            self._frame_boundry_node,
+            display_klass.SERIALIZED_NAME,
+        )
+
+        self._frame_boundry.set_scale(length, stud_height, height)
+
+        if self._rebuilds is None or self._frame_display is None or source is not None:
+            self.rebuild(source)
+            return
+
+        self._dirty = True
+        self._rebuilds.mark(self)
+
+    def rebuild(self, source: typing.Optional["Frame"] = None):
+        if self._dirty:
+            self._dirty = False
+            if self._rebuilds is not None:
+                self._rebuilds.discard(self)
+        if self._bill is not None:
+            self._bill.remove(self._cuts, self._panels)
+
+        self._rebuild_display(source)
+        if self._bill is not None:
+            self._panels = self.panels
+            self._bill.add(self._cuts, self._panels)
+
+    def _rebuild_display(self, source: typing.Optional["Frame"]):
+        settled = self._frame_display is None
         if self._frame_display is not None:
             self._frame_display.destroy()
+        self._shared_geometry = None
 
-        self._stud_width = stud_width
-        self._stud_height = stud_height
-        self._length = length
-        self._height = height
-        self._display_klass = display_klass
+        if source is not None:
+            self._cuts = list(source.cuts)
+            self._frame_display = geometry_cache.CachedDisplay(
+                self._display_parent,
+                source.shared_geometry().instance_to(self._display_parent),
+            )
+            return
 
-        self._frame_boundry.set_scale(self._length, self._stud_height, self._height)
-        self._frame_display = self._display_klass.create(
-            self._display_parent,
-            self._stud_width,
-            self._stud_height,
-            self._length,
-            self._height,
-            self._make_stud,
+        display_klass = self.display_klass
+        parameters = (self.stud_width, self.stud_height, self.length, self.height)
+
+        cached = None
+        if self._geometry_cache is not None:
+            key = self._geometry_cache.key(display_klass, *parameters)
+            cached = self._geometry_cache.load(key, self._display_parent)
+
+        if cached is not None:
+            self._frame_display, self._cuts = cached
+            return
+
+        self._cuts = []
+        display = display_klass.create(
+            self._display_parent, *parameters, self._make_recorded_stud
         )
+        self._frame_display = display
+        if self._geometry_cache is not None and settled:
+            self._geometry_cache.store(key, display, self._cuts)
 
+    def shared_geometry(self):
+        if self._dirty:
+            self.rebuild()
+        if self._shared_geometry is None:
+            self._shared_geometry = geometry_cache.flatten(self._frame_display.frame)
+        return self._shared_geometry
+
+    @scene_sync.mutates_scene
     def destroy(self):
+        if self._dirty:
+            self._dirty = False
+            if self._rebuilds is not None:
+                self._rebuilds.discard(self)
+        if self._bill is not None:
+            self._bill.remove(self._cuts, self._panels)
         self._world.remove(self._frame_boundry_node)
         self._frame_display.destroy()
         self._display_parent.remove_node()
+        self._registry.remove(self)
+
+    def _make_recorded_stud(
+        self, parent: core.NodePath, width: float, height: float, length: float
+    ):
+        self._cuts.append((width, height, length))
+        stud = self._make_stud(parent, width, height, length)
+        stud.set_shader_input(
+            frame_shader.PICK_INPUT,
+            frame_shader.pick_color(self._row + 1, len(self._cuts)),
+        )
+        return stud
+
+    def _store_vector(self, columns: typing.Tuple[str, str, str], value: core.Vec3):
+        for column, component in zip(columns, value):
+            getattr(self._store, column)[self._row] = component
+        self._store.revision += 1
@@ -0,0 +1,229 @@
+import os.path
+import typing
+import uuid
+
+from direct.showbase import Loader
+from panda3d import bullet, core
+
+from . import (
+    bill_of_materials,
+    frame,
+    frame_display,
+    frame_registry,
+    frame_shader,
+    geometry_cache,
+    layers,
+    project_file,
+    rebuild_queue,
+    scene_sync,
+)
+
+
+class FrameBuilder:
+    def __init__(
+        self,
+        loader: Loader.Loader,
+        scene: core.NodePath,
+        world: bullet.BulletWorld,
+        registry: frame_registry.FrameRegistry,
+        cache_directory: typing.Optional[str] = None,
+        rebuild_budget: typing.Optional[float] = None,
+    ):
+        self._scene = scene
+        self._world = world
+        self._registry = registry
+        self._layers = layers.Layers(scene, frame_shader.make())
+
+        self._frame_base: core.NodePath = self._scene.attach_new_node("frame_base")
+        box: core.NodePath = loader.load_model("box")
+        box.reparent_to(self._frame_base)
+        box.set_pos(-0.5, -0.5, 0)
+
+        textured = os.path.exists("wood.jpg")
+        if textured:
+            wood_texture: core.Texture = loader.load_texture("wood.jpg")
+            self._frame_base.set_texture(wood_texture, 1)
+        else:
+            self._frame_base.set_color(205 / 255, 133 / 255, 63 / 255)
+            self._frame_base.set_texture_off(1)
+        self._frame_base.hide()
+
+        self._geometry_cache: typing.Optional[geometry_cache.GeometryCache] = None
+        if cache_directory is not None:
+            self._geometry_cache = geometry_cache.GeometryCache(
+                cache_directory, "wood.jpg" if textured else "color"
+            )
+
+        self._rebuild_queue: typing.Optional[rebuild_queue.RebuildQueue] = None
+        if rebuild_budget is not None:
+            self._rebuild_queue = rebuild_queue.RebuildQueue(rebuild_budget)
+
+        self._bill = bill_of_materials.BillOfMaterials()
+
+    @property
+    def registry(self):
+        return self._registry
+
+    @property
+    def layers(self):
+        return self._layers
+
+    @property
+    def rebuild_queue(self):
+        return self._rebuild_queue
+
+    @property
+    def bill(self):
+        return self._bill
+
+    @scene_sync.mutates_scene
+    def build(
+        self,
+        stud_width: float,
+        stud_height: float,
+        length: float,
+        height: float,
+        display_klass: typing.Type[frame_display.FrameDisplay],
+    ):
+        return frame.Frame(
+            self._layers,
+            self._world,
+            self._registry,
+            stud_width,
+            stud_height,
+            length,
+            height,
+            self._new_stud,
+            display_klass,
+            self._geometry_cache,
+            rebuilds=self._rebuild_queue,
+            bill=self._bill,
+        )
+
+    @scene_sync.mutates_scene
+    def build_array(
+        self,
+        source: frame.Frame,
+        count: int,
+        offset: core.Vec3,
+        rotation_step: core.Vec3 = core.Vec3(0, 0, 0),
+    ) -> typing.List[frame.Frame]:
+        position = source.get_position()
+        rotation = source.get_rotation()
+        copies = [
+            frame.Frame(
+                self._layers,
+                self._world,
+                self._registry,
+                source.stud_width,
+                source.stud_height,
+                source.length,
+                source.height,
+                self._new_stud,
+                source.display_klass,
+                self._geometry_cache,
+                source,
+                self._rebuild_queue,
+                self._bill,
+                row=row,
+                position=position + offset * index,
+                rotation=rotation + rotation_step * index,
+                attach=False,
+            )
+            for index, row in enumerate(self._registry.reserve(count), 1)
+        ]
+
+        for copy in copies:
+            copy.attach()
+        return copies
+
+    @scene_sync.mutates_scene
+    def build_from_record(self, details: project_file.Record):
+        return self.build_records([details])[0]
+
+    @scene_sync.mutates_scene
+    def build_records(
+        self, records: typing.Sequence[project_file.Record]
+    ) -> typing.List[frame.Frame]:
+        display_klasses = [
+            frame_display.get_klass(details["frame_type"]) for details in records
+        ]
+        values = [
+            (
+                details["stud_width"],
+                details["stud_height"],
+                details["length"],
+                details["height"],
+                (details["x"], details["y"], details["z"]),
+                (details["h"], details["p"], details["r"]),
+            )
+            for details in records
+        ]
+
+        rows = self._registry.reserve(len(records))
+        new_frames: typing.List[frame.Frame] = []
+        try:
+            for row, display_klass, frame_values in zip(rows, display_klasses, values):
+                (
+                    stud_width,
+                    stud_height,
+                    length,
+                    height,
+                    position,
+                    rotation,
+                ) = frame_values
+                new_frames.append(
+                    frame.Frame(
+                        self._layers,
+                        self._world,
+                        self._registry,
+                        stud_width,
+                        stud_height,
+                        length,
+                        height,
+                        self._new_stud,
+                        display_klass,
+                        self._geometry_cache,
+                        rebuilds=self._rebuild_queue,
+                        bill=self._bill,
+                        row=row,
+                        position=position,
+                        rotation=rotation,
+                        attach=False,
+                    )
+                )
+        except BaseException:
+            for new_frame in new_frames:
+                new_frame.attach()
+                new_frame.destroy()
+            for row in rows[len(new_frames) :]:
+                self._registry.release(row)
+            raise
+
+        for new_frame, details in zip(new_frames, records):
+            if "uid" in details:
+                new_frame.set_uid(details["uid"])
+            new_frame.attach()
+        return new_frames
+
+    def _new_stud(
+        self, parent: core.NodePath, width: float, height: float, length: float
+    ):
+        result = self._new_frame_piece(parent)
+        display: core.NodePath = result.attach_new_node("display")
+        self._copy(self._frame_base, display)
+        display.set_scale(width, height, 1)
+
+        result.set_sz(length)
+        return result
+
+    @staticmethod
+    def _new_frame_piece(parent: core.NodePath) -> core.NodePath:
+        piece_id = uuid.uuid4()
+        return parent.attach_new_node(f"stud-{piece_id}")
+
+    @staticmethod
+    def _copy(source: core.NodePath, destination: core.NodePath):
+        source.show()
+        source.copy_to(destination)
+        source.hide()
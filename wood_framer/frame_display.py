@@ -1,9 +1,11 @@
 import abc
+import importlib
+import importlib.metadata
 import typing
 
 from panda3d import core
 
-from . import stud
+from . import sheet_goods, stud
 
 
 class FrameDisplay(metaclass=abc.ABCMeta):
@@ -25,6 +27,16 @@ class FrameDisplay(metaclass=abc.ABCMeta):
     ) -> "FrameDisplay":
         raise NotImplementedError()
 
+    @classmethod
+    def sheathing(
+        cls, stud_width: float, stud_height: float, length: float, height: float
+    ) -> typing.List[sheet_goods.Panel]:
+        return []
+
+    @property
+    def frame(self):
+        return self._frame
+
     def destroy(self):
         self._frame.remove_node()
 
@@ -35,12 +47,53 @@ class FrameDisplay(metaclass=abc.ABCMeta):
         return stud.make_label(self._display_parent, parent, text)
 
 
+ENTRY_POINT_GROUP = "wood_framer.frame_types"
+
+_BUILT_IN_TYPES = {
+    "wall_frame": "wood_framer.wall_frame:Display",
+    "door_frame": "wood_framer.door_frame:Display",
+    "roof_frame": "wood_framer.roof_frame:Display",
+    "wall_frame_with_ply_wood": "wood_framer.wall_frame_with_plywood:Display",
+}
+
 _display_types: typing.Dict[str, typing.Type[FrameDisplay]] = {}
+_installed_types: typing.Optional[typing.Dict[str, str]] = None
 
 
 def register(name: str, klass: typing.Type[FrameDisplay]):
     _display_types[name] = klass
 
 
-def get_klass(name: str):
-    return _display_types[name]
+def get_klass(name: str) -> typing.Type[FrameDisplay]:
+    registered = _display_types.get(name)
+    if registered is not None:
+        return registered
+
+    target = _BUILT_IN_TYPES.get(name) or installed_types().get(name)
+    if target is None:
+        raise KeyError(f"Unknown frame type: {name}")
+
+    module_name, _, attribute = target.partition(":")
+    target_object: typing.Any = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        target_object = getattr(target_object, part)
+
+    klass = typing.cast(typing.Type[FrameDisplay], target_object)
+    _display_types[name] = klass
+    return klass
+
+
+def installed_types() -> typing.Dict[str, str]:
+    global _installed_types
+
+    if _installed_types is None:
+        entry_points: typing.Any = importlib.metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            selected = entry_points.select(group=ENTRY_POINT_GROUP)
+        else:
+            selected = entry_points.get(ENTRY_POINT_GROUP, [])
+        _installed_types = {
+            entry_point.name: entry_point.value for entry_point in selected
+        }
+
+    return _installed_types
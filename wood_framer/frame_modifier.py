@@ -4,7 +4,7 @@ import typing
 from direct.showbase.DirectObject import DirectObject
 from panda3d import core
 
-from . import highlighter
+from . import frame, frame_shader, highlighter
 
 
 class FrameModifier(DirectObject):
@@ -26,8 +26,13 @@ class FrameModifier(DirectObject):
         self._grid_size = 0.5
 
         self._transforming = False
+        self._dragged_frame: typing.Optional[frame.Frame] = None
+        self._dragged_uid = ""
         self._start_position = core.Point3()
+        self._drag_position = core.Point3()
         self._last_mouse_position = core.Point2()
+        self._proxy = self._make_proxy(scene)
+        self._proxy_box: core.NodePath = self._proxy.find("box")
 
         self.accept("shift-mouse1", self._precheck_mouse)
         self.accept("mouse1-up", self._apply_transform)
@@ -157,20 +162,85 @@ class FrameModifier(DirectObject):
         if self._highligher.selected_frame is None:
             return
 
+        self._dragged_frame = self._highligher.selected_frame
+        self._dragged_uid = self._dragged_frame.uid
         self._last_mouse_position = core.Point2(self._highligher.get_mouse_position())
-        self._start_position = self._highligher.selected_frame.get_position()
+        self._start_position = self._dragged_frame.get_position()
+        self._drag_position = self._start_position
+        self._show_proxy(self._dragged_frame)
         self._transforming = True
         self._disable_mouse()
 
     def _apply_transform(self):
-        if self._transforming:
-            self._transforming = False
-            self._enable_mouse()
+        if not self._transforming:
+            return
+
+        if (
+            self._dragged_frame_is_live()
+            and self._drag_position != self._start_position
+        ):
+            self._dragged_frame.set_position(self._drag_position)
+        self._end_drag()
+
+    def _dragged_frame_is_live(self) -> bool:
+        dragged_frame = self._dragged_frame
+        return (
+            dragged_frame is not None
+            and not dragged_frame.node_path.is_empty()
+            and dragged_frame.uid == self._dragged_uid
+        )
+
+    def _end_drag(self):
+        self._transforming = False
+        self._proxy.hide()
+        self._dragged_frame = None
+        self._dragged_uid = ""
+        self._enable_mouse()
+
+    def _show_proxy(self, dragged_frame: frame.Frame):
+        bounds_min, bounds_max = dragged_frame.node_path.get_tight_bounds(
+            dragged_frame.node_path
+        )
+        self._proxy_box.set_pos(bounds_min)
+        self._proxy_box.set_scale(
+            core.Vec3(*(max(size, 0.01) for size in bounds_max - bounds_min))
+        )
+        self._proxy.set_pos(self._start_position)
+        self._proxy.set_hpr(dragged_frame.get_rotation())
+        self._proxy.show()
+
+    @staticmethod
+    def _make_proxy(scene: core.NodePath) -> core.NodePath:
+        lines = core.LineSegs("box")
+        lines.set_color(0, 1, 0, 1)
+        lines.set_thickness(2)
+        corners = [core.Point3(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+        for start in corners:
+            for end in corners:
+                if start < end and (end - start).length_squared() == 1:
+                    lines.move_to(start)
+                    lines.draw_to(end)
+
+        proxy = scene.attach_new_node("drag_proxy")
+        proxy.attach_new_node(lines.create())
+        proxy.set_light_off(1)
+        proxy.set_shader_off(1)
+        proxy.set_shader_input(frame_shader.PICK_INPUT, frame_shader.pick_color(0))
+        proxy.set_texture_off(1)
+        proxy.set_bin("fixed", 0)
+        proxy.set_depth_test(False)
+        proxy.set_depth_write(False)
+        proxy.hide()
+        return proxy
 
     def update(self):
         if not self._transforming:
             return
 
+        if not self._dragged_frame_is_live():
+            self._end_drag()
+            return
+
         new_mouse_position = core.Point2(self._highligher.get_mouse_position())
         mouse_delta: core.Vec2 = new_mouse_position - self._last_mouse_position
         mouse_delta_3d = core.Vec3(mouse_delta.x, 0, mouse_delta.y)
@@ -192,6 +262,5 @@ class FrameModifier(DirectObject):
         else:
             transform_direction = core.Vec3(0, 0, snapped_max_component)
 
-        self._highligher.selected_frame.set_position(
-            self._start_position + transform_direction
-        )
+        self._drag_position = self._start_position + transform_direction
+        self._proxy.set_pos(self._drag_position)
@@ -0,0 +1,125 @@
+import math
+import typing
+from collections import defaultdict
+
+from panda3d import core
+
+from . import bill_of_materials, frame, frame_registry, materials, project_file
+
+Cell = typing.Tuple[int, int]
+
+
+class FramePager:
+    _PAGE_OUT_SCALE = 1.25
+
+    def __init__(
+        self,
+        registry: frame_registry.FrameRegistry,
+        radius: float,
+        page_in: typing.Callable[[project_file.Record], frame.Frame],
+        page_out: typing.Callable[[frame.Frame], None],
+        bill: typing.Optional[bill_of_materials.BillOfMaterials] = None,
+    ):
+        self._registry = registry
+        self._radius = radius
+        self._page_in = page_in
+        self._page_out = page_out
+        self._bill = bill
+        self._cells: typing.Dict[Cell, typing.List[project_file.Record]] = defaultdict(
+            list
+        )
+        self._paged_out_count = 0
+
+    def __len__(self):
+        return self._paged_out_count
+
+    def add(self, record: project_file.Record):
+        centre_x, centre_y = self._centre(
+            record["x"], record["y"], record["h"], record["length"]
+        )
+        self._cells[self._cell(centre_x, centre_y)].append(record)
+        self._paged_out_count += 1
+        if self._bill is not None:
+            self._bill.add(
+                materials.record_cuts(record), materials.record_panels(record)
+            )
+
+    def clear(self):
+        if self._bill is not None:
+            for record in self.records():
+                self._bill.remove(
+                    materials.record_cuts(record), materials.record_panels(record)
+                )
+        self._cells.clear()
+        self._paged_out_count = 0
+
+    def records(self) -> typing.List[project_file.Record]:
+        return [record for cell in self._cells.values() for record in cell]
+
+    def update(self, viewer: core.Point3):
+        self._page_out_distant(viewer)
+        self._page_in_nearby(viewer)
+
+    def _page_out_distant(self, viewer: core.Point3):
+        store = self._registry.store
+        page_out_distance_squared = (self._radius * self._PAGE_OUT_SCALE) ** 2
+
+        for resident in self._registry:
+            if resident.is_selected:
+                continue
+
+            row = resident.id
+            centre_x, centre_y = self._centre(
+                store.x[row], store.y[row], store.h[row], store.length[row]
+            )
+            distance_squared = (centre_x - viewer.x) ** 2 + (centre_y - viewer.y) ** 2
+            if distance_squared > page_out_distance_squared:
+                record = store.record(row)
+                self._page_out(resident)
+                self.add(record)
+
+    def _page_in_nearby(self, viewer: core.Point3):
+        radius_squared = self._radius ** 2
+        viewer_cell = self._cell(viewer.x, viewer.y)
+
+        for cell_x in range(viewer_cell[0] - 1, viewer_cell[0] + 2):
+            for cell_y in range(viewer_cell[1] - 1, viewer_cell[1] + 2):
+                records = self._cells.get((cell_x, cell_y))
+                if not records:
+                    continue
+
+                remaining: typing.List[project_file.Record] = []
+                for record in records:
+                    centre_x, centre_y = self._centre(
+                        record["x"], record["y"], record["h"], record["length"]
+                    )
+                    distance_squared = (centre_x - viewer.x) ** 2 + (
+                        centre_y - viewer.y
+                    ) ** 2
+                    if distance_squared <= radius_squared:
+                        if self._bill is not None:
+                            self._bill.remove(
+                                materials.record_cuts(record),
+                                materials.record_panels(record),
+                            )
+                        self._page_in(record)
+                        self._paged_out_count -= 1
+                    else:
+                        remaining.append(record)
+
+                if remaining:
+                    self._cells[(cell_x, cell_y)] = remaining
+                else:
+                    del self._cells[(cell_x, cell_y)]
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return math.floor(x / self._radius), math.floor(y / self._radius)
+
+    @staticmethod
+    def _centre(x: float, y: float, heading: float, length: float):
+        heading_radians = math.radians(heading)
+        half_length = length / 2
+        return (
+            x + math.cos(heading_radians) * half_length,
+            y + math.sin(heading_radians) * half_length,
+        )
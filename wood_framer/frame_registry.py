@@ -0,0 +1,88 @@
+import typing
+from collections import defaultdict
+
+from . import frame_store
+
+if typing.TYPE_CHECKING:
+    from . import frame
+
+LumberSize = typing.Tuple[float, float]
+
+
+class FrameRegistry:
+    def __init__(self, store: frame_store.FrameStore):
+        self._store = store
+        self._frames: typing.Dict[int, "frame.Frame"] = {}
+        self._keys: typing.Dict[int, typing.Tuple[str, LumberSize]] = {}
+        self._by_type: typing.Dict[str, typing.Set[int]] = defaultdict(set)
+        self._by_lumber: typing.Dict[LumberSize, typing.Set[int]] = defaultdict(set)
+
+    @property
+    def store(self):
+        return self._store
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __iter__(self) -> typing.Iterator["frame.Frame"]:
+        return iter(list(self._frames.values()))
+
+    def get(self, frame_id: int) -> typing.Optional["frame.Frame"]:
+        return self._frames.get(frame_id)
+
+    def by_type(self, serialized_name: str) -> typing.List["frame.Frame"]:
+        return self._lookup(self._by_type.get(serialized_name))
+
+    def by_lumber(
+        self, stud_width: float, stud_height: float
+    ) -> typing.List["frame.Frame"]:
+        return self._lookup(self._by_lumber.get((stud_width, stud_height)))
+
+    def type_counts(self) -> typing.Dict[str, int]:
+        return {name: len(ids) for name, ids in self._by_type.items() if ids}
+
+    def reserve(self, count: int) -> typing.List[int]:
+        return self._store.allocate_many(count)
+
+    def add(
+        self, frame_to_add: "frame.Frame", frame_id: typing.Optional[int] = None
+    ) -> int:
+        if frame_id is None:
+            frame_id = self._store.allocate()
+        self._frames[frame_id] = frame_to_add
+        return frame_id
+
+    def reindex(self, frame_to_index: "frame.Frame"):
+        frame_id = frame_to_index.id
+        self._unindex(frame_id)
+
+        key = (
+            frame_to_index.display_klass.SERIALIZED_NAME,
+            (frame_to_index.stud_width, frame_to_index.stud_height),
+        )
+        self._keys[frame_id] = key
+        self._by_type[key[0]].add(frame_id)
+        self._by_lumber[key[1]].add(frame_id)
+
+    def remove(self, frame_to_remove: "frame.Frame"):
+        self.release(frame_to_remove.id)
+
+    def release(self, frame_id: int):
+        self._unindex(frame_id)
+        self._frames.pop(frame_id, None)
+        self._store.release(frame_id)
+
+    def _unindex(self, frame_id: int):
+        key = self._keys.pop(frame_id, None)
+        if key is None:
+            return
+
+        self._by_type[key[0]].discard(frame_id)
+        self._by_lumber[key[1]].discard(frame_id)
+
+    def _lookup(
+        self, frame_ids: typing.Optional[typing.Set[int]]
+    ) -> typing.List["frame.Frame"]:
+        if not frame_ids:
+            return []
+        return [self._frames[frame_id] for frame_id in sorted(frame_ids)]
@@ -0,0 +1,104 @@
+from panda3d import core
+
+HIGHLIGHT_INPUT = "highlight"
+PICK_INPUT = "pick_color"
+
+_VERTEX = """
+#version 120
+
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform mat3 p3d_NormalMatrix;
+
+attribute vec4 p3d_Vertex;
+attribute vec3 p3d_Normal;
+attribute vec4 p3d_Color;
+attribute vec2 p3d_MultiTexCoord0;
+
+varying vec3 normal;
+varying vec4 color;
+varying vec2 texcoord;
+
+void main() {
+    gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+    normal = p3d_NormalMatrix * p3d_Normal;
+    color = p3d_Color;
+    texcoord = p3d_MultiTexCoord0;
+}
+"""
+
+_FRAGMENT = """
+#version 120
+
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+uniform struct {
+    vec4 ambient;
+} p3d_LightModel;
+uniform struct {
+    vec4 color;
+    vec4 position;
+} p3d_LightSource[1];
+uniform vec4 highlight;
+
+varying vec3 normal;
+varying vec4 color;
+varying vec2 texcoord;
+
+void main() {
+    vec3 light_direction = normalize(p3d_LightSource[0].position.xyz);
+    float diffuse = max(dot(normalize(normal), light_direction), 0.0);
+    vec3 light = p3d_LightModel.ambient.rgb + p3d_LightSource[0].color.rgb * diffuse;
+
+    vec4 base = texture2D(p3d_Texture0, texcoord) * color * p3d_ColorScale;
+    gl_FragColor = vec4(mix(base.rgb * light, highlight.rgb, highlight.a), base.a);
+}
+"""
+
+_PICK_VERTEX = """
+#version 120
+
+uniform mat4 p3d_ModelViewProjectionMatrix;
+
+attribute vec4 p3d_Vertex;
+
+void main() {
+    gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+}
+"""
+
+_PICK_FRAGMENT = """
+#version 120
+
+uniform vec4 pick_color;
+
+void main() {
+    gl_FragColor = pick_color;
+}
+"""
+
+
+def make() -> core.Shader:
+    return core.Shader.make(core.Shader.SL_GLSL, _VERTEX, _FRAGMENT)
+
+
+def make_pick() -> core.Shader:
+    return core.Shader.make(core.Shader.SL_GLSL, _PICK_VERTEX, _PICK_FRAGMENT)
+
+
+def pick_color(pick_id: int, stud: int = 0) -> core.Vec4:
+    return core.Vec4(
+        (pick_id & 0xFF) / 255,
+        ((pick_id >> 8) & 0xFF) / 255,
+        ((pick_id >> 16) & 0xFF) / 255,
+        (stud if stud <= 0xFF else 0) / 255,
+    )
+
+
+def pick_id(color: core.Vec4) -> int:
+    return (
+        round(color[0] * 255) | round(color[1] * 255) << 8 | round(color[2] * 255) << 16
+    )
+
+
+def pick_stud(color: core.Vec4) -> int:
+    return round(color[3] * 255)
@@ -0,0 +1,125 @@
+import array
+import typing
+import uuid
+
+from . import frame_display
+
+
+class FrameStore:
+    PARAMETERS = ("stud_width", "stud_height", "length", "height")
+    POSITION = ("x", "y", "z")
+    ROTATION = ("h", "p", "r")
+    COLUMNS = ("type_id",) + PARAMETERS + POSITION + ROTATION
+
+    def __init__(self):
+        self._types: typing.List[typing.Type[frame_display.FrameDisplay]] = []
+        self._type_ids: typing.Dict[typing.Type[frame_display.FrameDisplay], int] = {}
+
+        self.type_id = array.array("i")
+        self.stud_width = array.array("d")
+        self.stud_height = array.array("d")
+        self.length = array.array("d")
+        self.height = array.array("d")
+        self.x = array.array("d")
+        self.y = array.array("d")
+        self.z = array.array("d")
+        self.h = array.array("d")
+        self.p = array.array("d")
+        self.r = array.array("d")
+        self.live = array.array("b")
+        self.uid: typing.List[str] = []
+
+        self._free_rows: typing.List[int] = []
+        self.revision = 0
+
+    def __len__(self):
+        return len(self.live) - len(self._free_rows)
+
+    def allocate(self) -> int:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            for column in self.COLUMNS:
+                getattr(self, column)[row] = 0
+            self.live[row] = 1
+            self.uid[row] = uuid.uuid4().hex
+            self.revision += 1
+            return row
+
+        for column in self.COLUMNS:
+            getattr(self, column).append(0)
+        self.live.append(1)
+        self.uid.append(uuid.uuid4().hex)
+        self.revision += 1
+        return len(self.live) - 1
+
+    def allocate_many(self, count: int) -> typing.List[int]:
+        split = max(0, len(self._free_rows) - count)
+        reused = self._free_rows[split:]
+        del self._free_rows[split:]
+        for row in reused:
+            for column in self.COLUMNS:
+                getattr(self, column)[row] = 0
+            self.live[row] = 1
+            self.uid[row] = uuid.uuid4().hex
+
+        first = len(self.live)
+        added = count - len(reused)
+        for column in self.COLUMNS:
+            values = getattr(self, column)
+            values.frombytes(bytes(added * values.itemsize))
+        self.live.extend([1] * added)
+        self.uid.extend(uuid.uuid4().hex for _ in range(added))
+        self.revision += 1
+        return reused + list(range(first, first + added))
+
+    def release(self, row: int):
+        self.live[row] = 0
+        self._free_rows.append(row)
+        self.revision += 1
+
+    def copy(self) -> "FrameStore":
+        result = FrameStore()
+        result._types = list(self._types)
+        result._type_ids = dict(self._type_ids)
+        for column in self.COLUMNS + ("live",):
+            setattr(result, column, getattr(self, column)[:])
+        result.uid = list(self.uid)
+        result._free_rows = list(self._free_rows)
+        result.revision = self.revision
+        return result
+
+    def rows(self) -> typing.List[int]:
+        return [row for row, live in enumerate(self.live) if live]
+
+    def type_id_for(self, klass: typing.Type[frame_display.FrameDisplay]) -> int:
+        type_id = self._type_ids.get(klass)
+        if type_id is None:
+            type_id = len(self._types)
+            self._types.append(klass)
+            self._type_ids[klass] = type_id
+        return type_id
+
+    def klass(self, row: int) -> typing.Type[frame_display.FrameDisplay]:
+        return self._types[self.type_id[row]]
+
+    def record(self, row: int) -> typing.Dict[str, typing.Any]:
+        return {
+            "frame_type": self.klass(row).SERIALIZED_NAME,
+            **{column: getattr(self, column)[row] for column in self.COLUMNS[1:]},
+            "uid": self.uid[row],
+        }
+
+    def records(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        type_names = [klass.SERIALIZED_NAME for klass in self._types]
+        columns = [getattr(self, column) for column in self.COLUMNS[1:]]
+        return [
+            {
+                "frame_type": type_names[type_id],
+                **dict(zip(self.COLUMNS[1:], values)),
+                "uid": uid,
+            }
+            for type_id, live, uid, *values in zip(
+                self.type_id, self.live, self.uid, *columns
+            )
+            if live
+        ]
@@ -0,0 +1,164 @@
+import functools
+import hashlib
+import inspect
+import json
+import os
+import os.path
+import tempfile
+import typing
+
+from panda3d import core
+
+from . import frame_display, frame_shader, sheet_goods, stud
+
+Cut = typing.Tuple[float, float, float]
+
+_CUTS_TAG = "cuts"
+
+
+class CachedDisplay(frame_display.FrameDisplay):
+    def __init__(self, display_parent: core.NodePath, frame: core.NodePath):
+        self._display_parent = display_parent
+        self._frame = frame
+
+
+class GeometryCache:
+    _MAX_BYTES = 256 * 1024 * 1024
+    _EXTENSION = ".bam"
+
+    def __init__(self, directory: str, salt: str, max_bytes: int = _MAX_BYTES):
+        self._directory = directory
+        self._salt = salt
+        self._max_bytes = max_bytes
+        self._size: typing.Optional[int] = None
+
+    def key(
+        self,
+        display_klass: typing.Type[frame_display.FrameDisplay],
+        stud_width: float,
+        stud_height: float,
+        length: float,
+        height: float,
+    ) -> str:
+        parameters = [
+            display_klass.SERIALIZED_NAME,
+            float(stud_width),
+            float(stud_height),
+            float(length),
+            float(height),
+            _code_version(display_klass),
+            self._salt,
+        ]
+        return hashlib.sha256(json.dumps(parameters).encode()).hexdigest()
+
+    def load(
+        self, key: str, display_parent: core.NodePath
+    ) -> typing.Optional[typing.Tuple[frame_display.FrameDisplay, typing.List[Cut]]]:
+        path = self._path(key)
+        if not os.path.isfile(path):
+            return None
+
+        model = core.ModelPool.load_model(core.Filename.from_os_specific(path))
+        if model is None or model.get_num_children() < 1:
+            return None
+        os.utime(path)
+
+        cached_frame = core.NodePath(model.get_child(0)).copy_to(display_parent)
+        cuts: typing.List[Cut] = [
+            (width, height, length)
+            for width, height, length in json.loads(cached_frame.get_tag(_CUTS_TAG))
+        ]
+        return CachedDisplay(display_parent, cached_frame), cuts
+
+    def store(
+        self,
+        key: str,
+        display: frame_display.FrameDisplay,
+        cuts: typing.List[Cut],
+    ):
+        flattened = flatten(display.frame)
+        flattened.set_tag(_CUTS_TAG, json.dumps(cuts))
+
+        os.makedirs(self._directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            prefix=".", suffix=self._EXTENSION, dir=self._directory
+        )
+        os.close(file_descriptor)
+        if not flattened.write_bam_file(core.Filename.from_os_specific(temporary_path)):
+            os.unlink(temporary_path)
+            return
+        os.replace(temporary_path, self._path(key))
+
+        if self._size is not None:
+            self._size += os.path.getsize(self._path(key))
+        self._evict()
+
+    def _path(self, key: str):
+        return os.path.join(self._directory, key + self._EXTENSION)
+
+    def _evict(self):
+        if self._size is None:
+            self._size = sum(entry.stat().st_size for entry in self._entries())
+        if self._size <= self._max_bytes:
+            return
+
+        for entry in sorted(self._entries(), key=lambda entry: entry.stat().st_mtime):
+            if self._size <= self._max_bytes:
+                break
+            self._size -= entry.stat().st_size
+            os.remove(entry.path)
+
+    def _entries(self) -> typing.List[os.DirEntry]:
+        return [
+            entry
+            for entry in os.scandir(self._directory)
+            if entry.name.endswith(self._EXTENSION) and not entry.name.startswith(".")
+        ]
+
+
+def flatten(frame: core.NodePath) -> core.NodePath:
+    result = frame.copy_to(core.NodePath(frame.get_name()))
+
+    for label in result.find_all_matches("**/+TextNode"):
+        baked = label.attach_new_node(label.node().generate())
+        baked.wrt_reparent_to(label.get_parent())
+        label.remove_node()
+
+    for model_root in result.find_all_matches("**/+ModelRoot"):
+        for child in model_root.get_children():
+            child.wrt_reparent_to(model_root.get_parent())
+        model_root.remove_node()
+
+    strip_shaders(result)
+    result.flatten_strong()
+    return result
+
+
+def strip_shaders(root: core.NodePath):
+    for node_path in [root] + list(root.find_all_matches("**")):
+        node_path.node().clear_attrib(core.ShaderAttrib)
+
+    for geom_node_path in root.find_all_matches("**/+GeomNode"):
+        geom_node = geom_node_path.node()
+        for index in range(geom_node.get_num_geoms()):
+            geom_node.set_geom_state(
+                index,
+                geom_node.get_geom_state(index).remove_attrib(core.ShaderAttrib),
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def _code_version(display_klass: typing.Type[frame_display.FrameDisplay]) -> str:
+    sources: typing.List[typing.Any] = [stud, frame_shader, sheet_goods]
+    sources += [klass for klass in display_klass.__mro__ if klass is not object]
+    source_files: typing.Set[str] = set()
+    for source in sources:
+        source_file = inspect.getsourcefile(source)
+        if source_file is not None:
+            source_files.add(source_file)
+
+    digest = hashlib.sha256()
+    for source_file in sorted(source_files):
+        with open(source_file, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
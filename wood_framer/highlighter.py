@@ -3,7 +3,7 @@ import typing
 from direct.showbase.DirectObject import DirectObject
 from panda3d import bullet, core
 
-from . import frame
+from . import color_picker, frame, layers
 
 
 class Highlighter(DirectObject):
@@ -14,15 +14,21 @@ class Highlighter(DirectObject):
         lens: core.Lens,
         camera: core.NodePath,
         world: bullet.BulletWorld,
+        frame_layers: layers.Layers,
+        picker: typing.Optional[color_picker.ColorPicker] = None,
     ):
         self._render = render
         self._mouse_watcher = mouse_watcher
         self._lens = lens
         self._camera = camera
         self._world = world
+        self._layers = frame_layers
+        self._picker = picker
 
         self._highlighted_frame: typing.Optional[frame.Frame] = None
         self._selected_frame: typing.Optional[frame.Frame] = None
+        self._highlighted_stud: typing.Optional[int] = None
+        self._selected_stud: typing.Optional[int] = None
 
         self._mouse_down = False
         self._last_mouse_position = core.Point2()
@@ -34,6 +40,10 @@ class Highlighter(DirectObject):
     def selected_frame(self):
         return self._selected_frame
 
+    @property
+    def selected_stud(self):
+        return self._selected_stud
+
     def update(self):
         if self._mouse_down:
             return
@@ -42,27 +52,29 @@ class Highlighter(DirectObject):
         if source is None:
             return
 
+        self._highlight(self._pick(source, target))
+
+    def clear(self):
         if self._highlighted_frame is not None:
             self._highlighted_frame.set_highlight(frame.FrameHighlight.none)
             self._highlighted_frame = None
+            self._highlighted_stud = None
 
-        hit: bullet.BulletClosestHitRayResult = self._world.ray_test_closest(
-            source, target, core.BitMask32.all_on()
-        )
-        if hit.has_hit():
-            highlighted_frame = frame.Frame.frame_from_node(hit.node)
-            if not highlighted_frame.is_selected:
-                self._highlighted_frame = highlighted_frame
-                self._highlighted_frame.set_highlight(frame.FrameHighlight.highlighted)
+        if self._selected_frame is not None:
+            self._selected_frame.set_highlight(frame.FrameHighlight.none)
+            self._selected_frame = None
+            self._selected_stud = None
 
-    def clear(self):
-        if self._highlighted_frame is not None:
+    def forget(self, frame_to_forget: frame.Frame):
+        if self._highlighted_frame is frame_to_forget:
             self._highlighted_frame.set_highlight(frame.FrameHighlight.none)
             self._highlighted_frame = None
+            self._highlighted_stud = None
 
-        if self._selected_frame is not None:
+        if self._selected_frame is frame_to_forget:
             self._selected_frame.set_highlight(frame.FrameHighlight.none)
             self._selected_frame = None
+            self._selected_stud = None
 
     def get_mouse_position(self):
         if not self._mouse_watcher.has_mouse():
@@ -82,14 +94,45 @@ class Highlighter(DirectObject):
         if mouse_delta.length_squared() > 0.00001:
             return
 
+        if self._picker is not None and self._mouse_watcher.has_mouse():
+            self._highlight(self._picker.pick_now(self._mouse_watcher.get_mouse()))
+
         if self._selected_frame is not None:
             self._selected_frame.set_highlight(frame.FrameHighlight.none)
             self._selected_frame = None
+            self._selected_stud = None
 
         if self._highlighted_frame is not None:
             self._selected_frame = self._highlighted_frame
             self._selected_frame.set_highlight(frame.FrameHighlight.selected)
+            self._selected_stud = self._highlighted_stud
+            self._highlighted_frame = None
+            self._highlighted_stud = None
+
+    def _highlight(self, picked_frame: typing.Optional[frame.Frame]):
+        if self._highlighted_frame is not None:
+            self._highlighted_frame.set_highlight(frame.FrameHighlight.none)
             self._highlighted_frame = None
+            self._highlighted_stud = None
+
+        if picked_frame is not None and not picked_frame.is_selected:
+            self._highlighted_frame = picked_frame
+            self._highlighted_frame.set_highlight(frame.FrameHighlight.highlighted)
+            if self._picker is not None:
+                self._highlighted_stud = self._picker.picked_stud
+
+    def _pick(
+        self, source: core.Point3, target: core.Point3
+    ) -> typing.Optional[frame.Frame]:
+        if self._picker is not None:
+            return self._picker.pick(self._mouse_watcher.get_mouse())
+
+        hit: bullet.BulletClosestHitRayResult = self._world.ray_test_closest(
+            source, target, self._layers.visible_mask
+        )
+        if not hit.has_hit():
+            return None
+        return frame.Frame.frame_from_node(hit.node)
 
     def _extrude_mouse_to_render_transform(
         self,
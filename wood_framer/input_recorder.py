@@ -0,0 +1,78 @@
+import json
+import typing
+
+from direct.showbase import Messenger
+from direct.task import Task
+from panda3d import core
+
+from . import project_file
+
+
+class InputRecorder:
+    _SORT = -45
+
+    def __init__(
+        self,
+        path: str,
+        messenger: Messenger.Messenger,
+        task_mgr: Task.TaskManager,
+        mouse_watcher: core.MouseWatcher,
+        camera: core.NodePath,
+        window_size: typing.Tuple[int, int],
+        tick_rate: float,
+        project: typing.List[project_file.Record],
+    ):
+        self._messenger = messenger
+        self._mouse_watcher = mouse_watcher
+        self._camera = camera
+        self._events: typing.List[str] = []
+
+        self._file = open(path, "w+", buffering=1)
+        self._write(
+            {"window": list(window_size), "tick_rate": tick_rate, "project": project}
+        )
+
+        self._send = messenger.send
+        messenger.send = self._record_event
+        task_mgr.add(self._record_frame, "record_input", sort=self._SORT)
+
+    def close(self):
+        self._messenger.send = self._send
+        self._file.close()
+
+    def _record_event(self, event: str, sentArgs=[], taskChain=None):
+        if not sentArgs and self._messenger.who_accepts(event):
+            self._events.append(event)
+        self._send(event, sentArgs, taskChain)
+
+    def _record_frame(self, task):
+        mouse = None
+        if self._mouse_watcher is not None and self._mouse_watcher.has_mouse():
+            mouse = list(self._mouse_watcher.get_mouse())
+
+        self._write(
+            {
+                "mouse": mouse,
+                "camera": list(self._camera.get_pos()) + list(self._camera.get_hpr()),
+                "events": self._events,
+            }
+        )
+        self._events = []
+        return task.cont
+
+    def _write(self, details: typing.Dict[str, typing.Any]):
+        self._file.write(json.dumps(details) + "\n")
+
+
+class ReplayMouse:
+    def __init__(self):
+        self._position: typing.Optional[core.Point2] = None
+
+    def set_mouse(self, position: typing.Optional[typing.Sequence[float]]):
+        self._position = None if position is None else core.Point2(*position)
+
+    def has_mouse(self):
+        return self._position is not None
+
+    def get_mouse(self):
+        return core.Point2(self._position)
@@ -0,0 +1,83 @@
+import json
+import math
+import os.path
+import tempfile
+import time
+import typing
+
+from panda3d import core
+
+from . import input_recorder, project_file
+
+_OFFSCREEN_CONFIG = """
+window-type offscreen
+audio-library-name null
+"""
+
+Report = typing.Dict[str, float]
+
+
+def replay(path: str, load_display: typing.Optional[str] = None) -> Report:
+    with open(path, "r") as file:
+        header = json.loads(next(file))
+        frames = [json.loads(line) for line in file]
+
+    width, height = header["window"]
+    config = f"{_OFFSCREEN_CONFIG}\nwin-size {width} {height}"
+    if load_display is not None:
+        config += f"\nload-display {load_display}"
+    core.load_prc_file_data("", config)
+
+    clock = core.ClockObject.get_global_clock()
+    clock.set_mode(core.ClockObject.M_non_real_time)
+    clock.set_frame_rate(1 / header["tick_rate"])
+
+    from . import app
+
+    mouse = input_recorder.ReplayMouse()
+    latencies: typing.List[float] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        project_path = os.path.join(directory, "project.json")
+        project_file.write(project_path, header["project"])
+
+        application = app.App(
+            False,
+            project_path=project_path,
+            mouse_watcher=mouse,
+            autosave_directory=os.path.join(directory, "autosave"),
+            geometry_cache_directory=os.path.join(directory, "geometry_cache"),
+        )
+        for details in frames:
+            started = time.perf_counter()
+
+            mouse.set_mouse(details["mouse"])
+            application.camera.set_pos_hpr(*details["camera"])
+            for event in details["events"]:
+                application.messenger.send(event)
+            application.task_mgr.step()
+
+            latencies.append(time.perf_counter() - started)
+
+        application.destroy()
+
+    return report(latencies)
+
+
+def report(latencies: typing.List[float]) -> Report:
+    ordered = sorted(latency * 1000 for latency in latencies)
+    if len(ordered) < 1:
+        return {"ticks": 0}
+
+    def _percentile(percent: float):
+        rank = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+        return ordered[rank]
+
+    return {
+        "ticks": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered),
+        "p50_ms": _percentile(50),
+        "p90_ms": _percentile(90),
+        "p99_ms": _percentile(99),
+        "max_ms": ordered[-1],
+    }
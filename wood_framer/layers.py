@@ -0,0 +1,67 @@
+import typing
+
+from panda3d import bullet, core
+
+
+class Layers:
+    _MAX_MASK_BITS = 32
+
+    def __init__(
+        self, scene: core.NodePath, shader: typing.Optional[core.Shader] = None
+    ):
+        self._scene = scene
+        self._shader = shader
+        self._nodes: typing.Dict[str, core.NodePath] = {}
+        self._masks: typing.Dict[str, core.BitMask32] = {}
+        self._hidden: typing.Set[str] = set()
+        self._visible_mask = core.BitMask32.all_on()
+
+    @property
+    def visible_mask(self):
+        return self._visible_mask
+
+    def is_visible(self, name: str):
+        return name not in self._hidden
+
+    def place(
+        self,
+        display_parent: core.NodePath,
+        body: bullet.BulletBodyNode,
+        name: str,
+    ):
+        display_parent.reparent_to(self._layer(name))
+        body.set_into_collide_mask(self._masks[name])
+
+    def set_visible(self, name: str, visible: bool):
+        layer = self._layer(name)
+        if visible:
+            self._hidden.discard(name)
+            layer.unstash()
+        else:
+            self._hidden.add(name)
+            layer.stash()
+
+        self._visible_mask = core.BitMask32.all_off()
+        for layer_name, mask in self._masks.items():
+            if layer_name not in self._hidden:
+                self._visible_mask |= mask
+
+    def toggle(self, name: str):
+        visible = not self.is_visible(name)
+        self.set_visible(name, visible)
+        return visible
+
+    def _layer(self, name: str):
+        layer = self._nodes.get(name)
+        if layer is not None:
+            return layer
+
+        layer = self._scene.attach_new_node(f"layer-{name}")
+        if self._shader is not None:
+            layer.set_shader(self._shader)
+        mask = core.BitMask32.bit(len(self._nodes) % self._MAX_MASK_BITS)
+        self._nodes[name] = layer
+        self._masks[name] = mask
+        if name not in self._hidden:
+            self._visible_mask |= mask
+        return layer
@@ -1,5 +1,25 @@
+import typing
+
 from . import app
 
 
-def main(debug_gui: bool):
-    app.App(debug_gui).run()
+def main(
+    debug_gui: bool,
+    floor_plan_path: typing.Optional[str] = None,
+    page_radius: typing.Optional[float] = None,
+    record_input_path: typing.Optional[str] = None,
+    threading_model: typing.Optional[str] = None,
+    script_path: typing.Optional[str] = None,
+    picking: str = "bullet",
+    profile_path: typing.Optional[str] = None,
+):
+    app.App(
+        debug_gui,
+        floor_plan_path,
+        page_radius,
+        record_input_path=record_input_path,
+        threading_model=threading_model,
+        script_path=script_path,
+        picking=picking,
+        profile_path=profile_path,
+    ).run()
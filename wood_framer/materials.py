@@ -0,0 +1,303 @@
+import concurrent.futures
+import csv
+import functools
+import glob
+import itertools
+import json
+import os
+import os.path
+import typing
+from collections import Counter, defaultdict
+
+from panda3d import core
+
+from . import frame_display, project_file, sheet_goods, stud
+
+Cut = typing.Tuple[float, float, float]
+Totals = typing.Dict[str, typing.Dict[str, float]]
+
+
+def lumber_type(stud_width: float, stud_height: float):
+    return f'{float(stud_width)}"x{float(stud_height)}"'
+
+
+@functools.lru_cache(maxsize=None)
+def cuts_for(
+    frame_type: str,
+    stud_width: float,
+    stud_height: float,
+    length: float,
+    height: float,
+) -> typing.Tuple[Cut, ...]:
+    cuts: typing.List[Cut] = []
+
+    def _make_stud(
+        parent: core.NodePath, width: float, depth: float, stud_length: float
+    ):
+        cuts.append((width, depth, stud_length))
+        return parent.attach_new_node("stud")
+
+    display_parent = core.NodePath("frame")
+    display = frame_display.get_klass(frame_type).create(
+        display_parent, stud_width, stud_height, length, height, _make_stud
+    )
+    display.destroy()
+
+    return tuple(cuts)
+
+
+def record_cuts(record: project_file.Record) -> typing.Tuple[Cut, ...]:
+    return cuts_for(
+        record["frame_type"],
+        record["stud_width"],
+        record["stud_height"],
+        record["length"],
+        record["height"],
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def panels_for(
+    frame_type: str,
+    stud_width: float,
+    stud_height: float,
+    length: float,
+    height: float,
+) -> typing.Tuple[sheet_goods.Panel, ...]:
+    return tuple(
+        frame_display.get_klass(frame_type).sheathing(
+            stud_width, stud_height, length, height
+        )
+    )
+
+
+def record_panels(record: project_file.Record) -> typing.Tuple[sheet_goods.Panel, ...]:
+    return panels_for(
+        record["frame_type"],
+        record["stud_width"],
+        record["stud_height"],
+        record["length"],
+        record["height"],
+    )
+
+
+def write_report(
+    file: typing.TextIO,
+    frame_cuts: typing.Iterable[typing.Sequence[Cut]],
+    frame_panels: typing.Iterable[typing.Sequence[sheet_goods.Panel]] = (),
+):
+    total_lumber: typing.Dict[str, float] = defaultdict(lambda: 0.0)
+    pieces: typing.List[typing.Tuple[float, float]] = []
+
+    for index, (cuts_to_calculate, panels) in enumerate(
+        itertools.zip_longest(frame_cuts, frame_panels, fillvalue=())
+    ):
+        cuts: typing.List[typing.Tuple[str, float]] = []
+        lumber: typing.Dict[str, float] = defaultdict(lambda: 0.0)
+        for stud_width, stud_height, length in cuts_to_calculate:
+            cut_lumber_type = lumber_type(stud_width, stud_height)
+            lumber[cut_lumber_type] += length
+            total_lumber[cut_lumber_type] += length
+            cuts.append((cut_lumber_type, length))
+
+        if len(lumber) > 0:
+            file.write(f"Frame {index}:\n")
+            file.write("\tLumber:\n")
+            for cut_lumber_type, length in lumber.items():
+                file.write(
+                    f"\t\t{cut_lumber_type}: {stud.inches_to_nice_length(length)}\n"
+                )
+
+            file.write("\tCuts:\n")
+            for cut_lumber_type, length in cuts:
+                file.write(
+                    f"\t\t{cut_lumber_type}: {stud.inches_to_nice_length(length)}\n"
+                )
+
+        if len(panels) > 0:
+            file.write("\tSheets:\n")
+            for _, _, width, height in panels:
+                file.write(f"\t\t{_panel_size(width, height)}\n")
+                pieces.append((width, height))
+
+    file.write("Total:\n")
+    for cut_lumber_type, length in total_lumber.items():
+        file.write(f"\t{cut_lumber_type}: {stud.inches_to_nice_length(length)}\n")
+    if len(pieces) > 0:
+        file.write(
+            f"\t{sheet_goods.SHEET_NAME}: {sheet_goods.sheet_count(pieces)} sheets"
+            f" ({len(pieces)} pieces)\n"
+        )
+
+
+def project_totals(path: str) -> Totals:
+    return records_totals(project_file.read(path))
+
+
+def records_totals(records: typing.Iterable[project_file.Record]) -> Totals:
+    parameters = Counter(
+        (
+            record["frame_type"],
+            record["stud_width"],
+            record["stud_height"],
+            record["length"],
+            record["height"],
+        )
+        for record in records
+    )
+
+    totals: Totals = defaultdict(lambda: {"length": 0.0, "cuts": 0})
+    pieces: typing.List[typing.Tuple[float, float]] = []
+    for frame_parameters, count in parameters.items():
+        for stud_width, stud_height, length in cuts_for(*frame_parameters):
+            lumber_totals = totals[lumber_type(stud_width, stud_height)]
+            lumber_totals["length"] += length * count
+            lumber_totals["cuts"] += count
+        for _, _, width, height in panels_for(*frame_parameters):
+            pieces += [(width, height)] * count
+
+    if len(pieces) > 0:
+        totals[sheet_goods.SHEET_NAME] = {
+            "sheets": sheet_goods.sheet_count(pieces),
+            "cuts": len(pieces),
+        }
+
+    return dict(totals)
+
+
+def sheet_totals(records: typing.Iterable[project_file.Record]) -> Totals:
+    pieces = [
+        (width, height)
+        for record in records
+        for _, _, width, height in record_panels(record)
+    ]
+    if len(pieces) < 1:
+        return {}
+
+    return {
+        sheet_goods.SHEET_NAME: {
+            "sheets": sheet_goods.sheet_count(pieces),
+            "cuts": len(pieces),
+        }
+    }
+
+
+def find_projects(pattern: str, exclude: typing.Iterable[str] = ()) -> typing.List[str]:
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*.json")
+    excluded = {os.path.abspath(path) for path in exclude}
+    return sorted(
+        path for path in glob.glob(pattern) if os.path.abspath(path) not in excluded
+    )
+
+
+def batch_totals(
+    paths: typing.List[str], jobs: typing.Optional[int] = None
+) -> typing.Tuple[typing.Dict[str, Totals], Totals, typing.Dict[str, str]]:
+    workers = jobs or os.cpu_count() or 1
+    chunk_size = max(1, len(paths) // (4 * workers))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = dict(
+            zip(
+                paths,
+                executor.map(_project_totals_or_error, paths, chunksize=chunk_size),
+            )
+        )
+
+    per_project = {
+        path: result for path, result in results.items() if isinstance(result, dict)
+    }
+    failed = {
+        path: result for path, result in results.items() if isinstance(result, str)
+    }
+
+    combined: Totals = defaultdict(lambda: defaultdict(lambda: 0))
+    for totals in per_project.values():
+        for lumber, lumber_totals in totals.items():
+            for key, value in lumber_totals.items():
+                combined[lumber][key] += value
+
+    return (
+        per_project,
+        {lumber: dict(values) for lumber, values in combined.items()},
+        failed,
+    )
+
+
+def write_batch_report(
+    output_prefix: str,
+    per_project: typing.Dict[str, Totals],
+    combined: Totals,
+    failed: typing.Optional[typing.Dict[str, str]] = None,
+):
+    failed = failed or {}
+
+    with open(f"{output_prefix}.txt", "w+") as file:
+        for path, totals in per_project.items():
+            file.write(f"{path}:\n")
+            _write_totals(file, totals, "\t")
+        file.write("Total:\n")
+        _write_totals(file, combined, "\t")
+        if failed:
+            file.write("Failed:\n")
+            for path, error in failed.items():
+                file.write(f"\t{path}: {error}\n")
+
+    with open(f"{output_prefix}.csv", "w+", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["project", "lumber", "length", "cuts", "sheets", "error"])
+        for path, totals in list(per_project.items()) + [("total", combined)]:
+            for lumber, lumber_totals in totals.items():
+                writer.writerow(
+                    [
+                        path,
+                        lumber,
+                        lumber_totals.get("length", ""),
+                        lumber_totals["cuts"],
+                        lumber_totals.get("sheets", ""),
+                        "",
+                    ]
+                )
+        for path, error in failed.items():
+            writer.writerow([path, "", "", "", "", error])
+
+    with open(f"{output_prefix}.json", "w+") as file:
+        json.dump(
+            {"projects": per_project, "total": combined, "failed": failed},
+            file,
+            indent=2,
+        )
+
+
+def run_batch(pattern: str, output_prefix: str, jobs: typing.Optional[int] = None):
+    reports = [f"{output_prefix}.{extension}" for extension in ("txt", "csv", "json")]
+    per_project, combined, failed = batch_totals(
+        find_projects(pattern, exclude=reports), jobs
+    )
+    write_batch_report(output_prefix, per_project, combined, failed)
+
+
+def _project_totals_or_error(path: str) -> typing.Union[Totals, str]:
+    try:
+        return project_totals(path)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+
+
+def _write_totals(file: typing.TextIO, totals: Totals, indent: str):
+    for lumber, lumber_totals in totals.items():
+        if "sheets" in lumber_totals:
+            file.write(
+                f"{indent}{lumber}: {lumber_totals['sheets']} sheets"
+                f" ({lumber_totals['cuts']} pieces)\n"
+            )
+            continue
+
+        file.write(
+            f"{indent}{lumber}: {stud.inches_to_nice_length(lumber_totals['length'])}"
+            f" ({lumber_totals['cuts']} cuts)\n"
+        )
+
+
+def _panel_size(width: float, height: float):
+    return f"{stud.inches_to_nice_length(width)}x{stud.inches_to_nice_length(height)}"
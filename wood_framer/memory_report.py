@@ -0,0 +1,150 @@
+import os.path
+import shutil
+import tempfile
+import tracemalloc
+import typing
+from collections import defaultdict
+
+from panda3d import core
+
+from . import frame_registry
+
+Usage = typing.Dict[str, int]
+
+_OFFSCREEN_CONFIG = """
+window-type offscreen
+audio-library-name null
+"""
+
+METRICS = (
+    "frames",
+    "studs",
+    "nodes",
+    "geoms",
+    "geometry_bytes",
+    "shared_geometry_bytes",
+    "labels",
+    "label_bytes",
+    "bodies",
+)
+
+
+def run(
+    project_path: str,
+    file: typing.TextIO,
+    load_display: typing.Optional[str] = None,
+):
+    config = _OFFSCREEN_CONFIG
+    if load_display is not None:
+        config += f"\nload-display {load_display}"
+    core.load_prc_file_data("", config)
+
+    from . import app, input_recorder
+
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as directory:
+        project_copy = os.path.join(directory, "project.json")
+        shutil.copyfile(project_path, project_copy)
+
+        application = app.App(
+            False,
+            project_path=project_copy,
+            mouse_watcher=input_recorder.ReplayMouse(),
+        )
+        application.task_mgr.step()
+        write_report(file, collect(application.frame_registry), python_allocations())
+        application.destroy()
+    tracemalloc.stop()
+
+
+def collect(registry: frame_registry.FrameRegistry) -> typing.Dict[str, Usage]:
+    usage: typing.Dict[str, Usage] = defaultdict(lambda: dict.fromkeys(METRICS, 0))
+    seen: typing.Set[int] = set()
+
+    for frame_to_measure in registry:
+        totals = usage[frame_to_measure.display_klass.SERIALIZED_NAME]
+        root = frame_to_measure.node_path
+
+        totals["frames"] += 1
+        totals["studs"] += len(frame_to_measure.cuts)
+        totals["nodes"] += root.find_all_matches("**").get_num_paths() + 1
+        totals["bodies"] += root.find_all_matches(
+            "**/+BulletRigidBodyNode"
+        ).get_num_paths()
+
+        for geom_node in root.find_all_matches("**/+GeomNode"):
+            for geom in geom_node.node().get_geoms():
+                totals["geoms"] += 1
+                unique, shared = _geom_bytes(geom, seen)
+                totals["geometry_bytes"] += unique
+                totals["shared_geometry_bytes"] += shared
+
+        for label in root.find_all_matches("**/+TextNode"):
+            totals["labels"] += 1
+            generated = core.NodePath(label.node().get_internal_geom())
+            for geom_node in generated.find_all_matches("**/+GeomNode"):
+                for geom in geom_node.node().get_geoms():
+                    totals["label_bytes"] += sum(_geom_bytes(geom, seen))
+
+    return dict(usage)
+
+
+def python_allocations(limit: int = 10) -> typing.List[typing.Tuple[str, int, int]]:
+    if not tracemalloc.is_tracing():
+        return []
+
+    snapshot = tracemalloc.take_snapshot()
+    traced = snapshot.statistics("traceback")
+    package = snapshot.filter_traces(
+        [tracemalloc.Filter(True, os.path.join(os.path.dirname(__file__), "*"))]
+    ).statistics("filename")
+    return [
+        ("all", sum(stat.size for stat in traced), sum(stat.count for stat in traced))
+    ] + [
+        (os.path.basename(stat.traceback[0].filename), stat.size, stat.count)
+        for stat in package[:limit]
+    ]
+
+
+def write_report(
+    file: typing.TextIO,
+    usage: typing.Dict[str, Usage],
+    allocations: typing.List[typing.Tuple[str, int, int]],
+):
+    totals: Usage = dict.fromkeys(METRICS, 0)
+    for type_usage in usage.values():
+        for metric, value in type_usage.items():
+            totals[metric] += value
+
+    for name, type_usage in list(usage.items()) + [("Total", totals)]:
+        file.write(f"{name}:\n")
+        for metric in METRICS:
+            file.write(f"\t{metric}: {type_usage[metric]}\n")
+
+        owned = type_usage["geometry_bytes"] + type_usage["label_bytes"]
+        if type_usage["frames"] > 0:
+            file.write(f"\tbytes_per_frame: {owned / type_usage['frames']:.0f}\n")
+        if type_usage["studs"] > 0:
+            file.write(f"\tbytes_per_stud: {owned / type_usage['studs']:.0f}\n")
+
+    file.write("Python:\n")
+    if len(allocations) < 1:
+        file.write("\tnot traced, start with PYTHONTRACEMALLOC=1\n")
+    for filename, size, count in allocations:
+        file.write(f"\t{filename}: {size} bytes in {count} blocks\n")
+
+
+def _geom_bytes(geom: core.Geom, seen: typing.Set[int]) -> typing.Tuple[int, int]:
+    unique = shared = 0
+
+    for part, size in (
+        (geom, geom.get_num_bytes()),
+        (geom.get_vertex_data(), geom.get_vertex_data().get_num_bytes()),
+    ):
+        if part.this in seen:
+            shared += size
+        else:
+            seen.add(part.this)
+            unique += size
+
+    return unique, shared
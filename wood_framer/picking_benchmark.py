@@ -0,0 +1,95 @@
+import concurrent.futures
+import os.path
+import random
+import shutil
+import tempfile
+import time
+import typing
+
+from panda3d import core
+
+from . import input_recorder, input_replay
+
+BACKENDS = ("bullet", "color")
+
+_OFFSCREEN_CONFIG = """
+window-type offscreen
+audio-library-name null
+sync-video false
+"""
+
+Report = typing.Dict[str, input_replay.Report]
+
+
+def run(
+    project_path: str,
+    picks: int = 300,
+    load_display: typing.Optional[str] = None,
+    backends: typing.Sequence[str] = BACKENDS,
+) -> typing.Dict[str, Report]:
+    reports: typing.Dict[str, Report] = {}
+    for backend in backends:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            reports[backend] = executor.submit(
+                _measure, project_path, picks, load_display, backend
+            ).result()
+
+    return reports
+
+
+def _measure(
+    project_path: str,
+    picks: int,
+    load_display: typing.Optional[str],
+    backend: str,
+) -> Report:
+    config = _OFFSCREEN_CONFIG
+    if load_display is not None:
+        config += f"\nload-display {load_display}"
+    core.load_prc_file_data("", config)
+
+    from . import app
+
+    pick_times: typing.List[float] = []
+    frame_times: typing.List[float] = []
+    mouse = input_recorder.ReplayMouse()
+    positions = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        project_copy = os.path.join(directory, "project.json")
+        shutil.copyfile(project_path, project_copy)
+
+        application = app.App(
+            False,
+            project_path=project_copy,
+            mouse_watcher=mouse,
+            picking=backend,
+            autosave_directory=os.path.join(directory, "autosave"),
+            geometry_cache_directory=os.path.join(directory, "geometry_cache"),
+        )
+        application.disable_mouse()
+        bounds_min, bounds_max = application.scene.get_tight_bounds(application.render)
+        centre = (bounds_min + bounds_max) / 2
+        radius = max((bounds_max - bounds_min).length() / 2, 1)
+        application.camera.set_pos(centre + core.Vec3(0, -1.5, 0.75) * radius)
+        application.camera.look_at(centre)
+
+        highlighter = application.highlighter
+        for _ in range(picks):
+            mouse.set_mouse((positions.uniform(-1, 1), positions.uniform(-1, 1)))
+
+            started = time.perf_counter()
+            highlighter.update()
+            picked = time.perf_counter()
+            application.task_mgr.step()
+            finished = time.perf_counter()
+
+            pick_times.append(picked - started)
+            frame_times.append(finished - started)
+
+        application.destroy()
+
+    return {
+        "pick": input_replay.report(pick_times),
+        "frame": input_replay.report(frame_times),
+    }
@@ -0,0 +1,104 @@
+import concurrent.futures
+import math
+import os.path
+import shutil
+import tempfile
+import time
+import typing
+
+from panda3d import core
+
+from . import input_recorder, input_replay
+
+THREADING_MODELS = ("", "Cull/Draw")
+
+_OFFSCREEN_CONFIG = """
+window-type offscreen
+audio-library-name null
+sync-video false
+"""
+
+
+def run(
+    project_path: str,
+    frames: int = 300,
+    rebuilds_per_frame: int = 1,
+    load_display: typing.Optional[str] = None,
+    threading_models: typing.Sequence[str] = THREADING_MODELS,
+) -> typing.Dict[str, input_replay.Report]:
+    reports: typing.Dict[str, input_replay.Report] = {}
+    for threading_model in threading_models:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            reports[threading_model or "single"] = executor.submit(
+                _measure,
+                project_path,
+                frames,
+                rebuilds_per_frame,
+                load_display,
+                threading_model,
+            ).result()
+
+    return reports
+
+
+def _measure(
+    project_path: str,
+    frames: int,
+    rebuilds_per_frame: int,
+    load_display: typing.Optional[str],
+    threading_model: str,
+) -> input_replay.Report:
+    config = _OFFSCREEN_CONFIG
+    if load_display is not None:
+        config += f"\nload-display {load_display}"
+    core.load_prc_file_data("", config)
+
+    from . import app
+
+    frame_times: typing.List[float] = []
+    with tempfile.TemporaryDirectory() as directory:
+        project_copy = os.path.join(directory, "project.json")
+        shutil.copyfile(project_path, project_copy)
+
+        application = app.App(
+            False,
+            project_path=project_copy,
+            mouse_watcher=input_recorder.ReplayMouse(),
+            threading_model=threading_model or None,
+            autosave_directory=os.path.join(directory, "autosave"),
+            geometry_cache_directory=os.path.join(directory, "geometry_cache"),
+        )
+        application.disable_mouse()
+        bounds_min, bounds_max = application.scene.get_tight_bounds(application.render)
+        centre = (bounds_min + bounds_max) / 2
+        radius = max((bounds_max - bounds_min).length() / 2, 1)
+
+        frames_to_rebuild = list(application.frame_registry)
+        for index in range(frames):
+            started = time.perf_counter()
+
+            angle = 2 * math.pi * index / frames
+            application.camera.set_pos(
+                centre + core.Vec3(math.cos(angle), math.sin(angle), 0.5) * radius * 1.5
+            )
+            application.camera.look_at(centre)
+            for rebuild in range(rebuilds_per_frame):
+                if len(frames_to_rebuild) < 1:
+                    break
+                frame_to_rebuild = frames_to_rebuild[
+                    (index * rebuilds_per_frame + rebuild) % len(frames_to_rebuild)
+                ]
+                frame_to_rebuild.update(
+                    frame_to_rebuild.stud_width,
+                    frame_to_rebuild.stud_height,
+                    frame_to_rebuild.length,
+                    frame_to_rebuild.height,
+                    frame_to_rebuild.display_klass,
+                )
+            application.task_mgr.step()
+
+            frame_times.append(time.perf_counter() - started)
+
+        application.destroy()
+
+    return input_replay.report(frame_times)
@@ -0,0 +1,164 @@
+import typing
+from collections import defaultdict
+
+from . import frame_store, materials, project_file, sheet_goods, stud
+
+Pair = typing.Tuple[project_file.Record, project_file.Record]
+
+_PARAMETERS = ("frame_type",) + frame_store.FrameStore.PARAMETERS
+_PLACEMENT = frame_store.FrameStore.POSITION + frame_store.FrameStore.ROTATION
+
+
+class Diff(typing.NamedTuple):
+    added: typing.List[project_file.Record]
+    removed: typing.List[project_file.Record]
+    moved: typing.List[Pair]
+    resized: typing.List[Pair]
+    materials: materials.Totals
+
+
+def diff_files(old_path: str, new_path: str) -> Diff:
+    return diff(project_file.read(old_path), project_file.read(new_path))
+
+
+def diff(
+    old_records: typing.List[project_file.Record],
+    new_records: typing.List[project_file.Record],
+) -> Diff:
+    old_by_uid = {record["uid"]: record for record in old_records if "uid" in record}
+    pairs: typing.List[Pair] = []
+    added: typing.List[project_file.Record] = []
+
+    for record in new_records:
+        previous = old_by_uid.pop(record.get("uid"), None)
+        if previous is None:
+            added.append(record)
+        else:
+            pairs.append((previous, record))
+
+    removed = [
+        record
+        for record in old_records
+        if "uid" not in record or record["uid"] in old_by_uid
+    ]
+
+    added, removed, _ = _pair(added, removed, _PARAMETERS + _PLACEMENT)
+    added, removed, same_place = _pair(added, removed, _PLACEMENT)
+    added, removed, same_size = _pair(added, removed, _PARAMETERS)
+
+    moved = same_size + [
+        pair for pair in pairs if _key(pair[0], _PLACEMENT) != _key(pair[1], _PLACEMENT)
+    ]
+    resized = same_place + [
+        pair
+        for pair in pairs
+        if _key(pair[0], _PARAMETERS) != _key(pair[1], _PARAMETERS)
+    ]
+
+    changes = _subtract(
+        materials.records_totals(added + [pair[1] for pair in resized]),
+        materials.records_totals(removed + [pair[0] for pair in resized]),
+    )
+    changes.pop(sheet_goods.SHEET_NAME, None)
+    changes.update(
+        _subtract(
+            materials.sheet_totals(new_records), materials.sheet_totals(old_records)
+        )
+    )
+
+    return Diff(added, removed, moved, resized, changes)
+
+
+def write_report(file: typing.TextIO, project_diff: Diff):
+    for title, records in (
+        ("Added", project_diff.added),
+        ("Removed", project_diff.removed),
+    ):
+        file.write(f"{title}: {len(records)}\n")
+        for record in records:
+            file.write(f"\t{_describe(record)}\n")
+
+    for title, pairs in (
+        ("Moved", project_diff.moved),
+        ("Resized", project_diff.resized),
+    ):
+        file.write(f"{title}: {len(pairs)}\n")
+        for old_record, new_record in pairs:
+            file.write(f"\t{_describe(old_record)} -> {_describe(new_record)}\n")
+
+    file.write("Materials:\n")
+    for lumber, delta in project_diff.materials.items():
+        if "sheets" in delta:
+            file.write(
+                f"\t{lumber}: {delta['sheets']:+} sheets ({delta['cuts']:+} pieces)\n"
+            )
+            continue
+
+        file.write(
+            f"\t{lumber}: {_signed_length(delta['length'])} ({delta['cuts']:+} cuts)\n"
+        )
+
+
+def _pair(
+    added: typing.List[project_file.Record],
+    removed: typing.List[project_file.Record],
+    columns: typing.Tuple[str, ...],
+) -> typing.Tuple[
+    typing.List[project_file.Record],
+    typing.List[project_file.Record],
+    typing.List[Pair],
+]:
+    candidates: typing.Dict[
+        typing.Tuple, typing.List[project_file.Record]
+    ] = defaultdict(list)
+    for record in removed:
+        candidates[_key(record, columns)].append(record)
+
+    unpaired: typing.List[project_file.Record] = []
+    pairs: typing.List[Pair] = []
+    for record in added:
+        matches = candidates.get(_key(record, columns))
+        if matches:
+            pairs.append((matches.pop(), record))
+        else:
+            unpaired.append(record)
+
+    return unpaired, [record for left in candidates.values() for record in left], pairs
+
+
+def _key(record: project_file.Record, columns: typing.Tuple[str, ...]):
+    return tuple(
+        record[column] if column == "frame_type" else round(record[column], 3)
+        for column in columns
+    )
+
+
+def _subtract(new: materials.Totals, old: materials.Totals) -> materials.Totals:
+    delta: materials.Totals = {}
+    for lumber in list(old) + [lumber for lumber in new if lumber not in old]:
+        new_totals = new.get(lumber, {})
+        old_totals = old.get(lumber, {})
+        values = {
+            key: new_totals.get(key, 0) - old_totals.get(key, 0)
+            for key in {**old_totals, **new_totals}
+        }
+        if any(abs(value) > 1e-6 for value in values.values()):
+            delta[lumber] = values
+
+    return delta
+
+
+def _describe(record: project_file.Record):
+    return (
+        f"{record['frame_type']}"
+        f" {materials.lumber_type(record['stud_width'], record['stud_height'])}"
+        f" {stud.inches_to_nice_length(record['length'])}"
+        f"x{stud.inches_to_nice_length(record['height'])}"
+        f" at ({record['x']:.1f}, {record['y']:.1f}, {record['z']:.1f})"
+    )
+
+
+def _signed_length(inches: float):
+    if abs(inches) < 1e-6:
+        return "0"
+    return ("+" if inches > 0 else "-") + stud.inches_to_nice_length(abs(inches))
@@ -0,0 +1,28 @@
+import json
+import os
+import os.path
+import tempfile
+import typing
+
+Record = typing.Dict[str, typing.Any]
+
+
+def read(path: str) -> typing.List[Record]:
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def write(path: str, records: typing.List[Record]):
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        prefix=".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(records, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
@@ -0,0 +1,178 @@
+import logging
+import math
+import os
+import typing
+from collections import defaultdict
+
+from . import frame, frame_display, frame_registry, frame_store, project_file
+
+_Signatures = typing.Dict[typing.Tuple, typing.List[frame.Frame]]
+
+_logger = logging.getLogger(__name__)
+
+
+class Changes(typing.NamedTuple):
+    created: int
+    updated: int
+    moved: int
+    destroyed: int
+
+
+class ProjectWatcher:
+    def __init__(self, path: str):
+        self._path = path
+        self._modified = self._modified_time()
+
+    def mark_current(self):
+        self._modified = self._modified_time()
+
+    def changed_records(self) -> typing.Optional[typing.List[project_file.Record]]:
+        modified = self._modified_time()
+        if modified is None or modified == self._modified:
+            return None
+
+        try:
+            records = project_file.read(self._path)
+        except (OSError, ValueError):
+            return None
+
+        self._modified = modified
+        try:
+            validate(records)
+        except ValueError as error:
+            _logger.warning("Not reloading %s: %s", self._path, error)
+            return None
+        return records
+
+    def _modified_time(self):
+        try:
+            return os.stat(self._path).st_mtime_ns
+        except OSError:
+            return None
+
+
+def validate(records: typing.Any):
+    if not isinstance(records, list):
+        raise ValueError("expected a list of frames")
+
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise ValueError(f"entry {index + 1}: expected an object")
+        try:
+            frame_display.get_klass(str(record.get("frame_type")))
+        except KeyError as error:
+            raise ValueError(f"entry {index + 1}: {error.args[0]}") from None
+
+        for column in frame_store.FrameStore.COLUMNS[1:]:
+            if column not in record:
+                raise ValueError(f"entry {index + 1}: {column} is missing")
+            if isinstance(record[column], bool) or not isinstance(
+                record[column], (int, float)
+            ):
+                raise ValueError(f"entry {index + 1}: {column} must be a number")
+
+
+def apply(
+    registry: frame_registry.FrameRegistry,
+    records: typing.List[project_file.Record],
+    create: typing.Callable[[project_file.Record], typing.Any],
+    destroy: typing.Callable[[frame.Frame], None],
+) -> Changes:
+    live = {live_frame.uid: live_frame for live_frame in registry}
+    unmatched: typing.Optional[_Signatures] = None
+    created = updated = moved = 0
+
+    for record in records:
+        existing = live.pop(record.get("uid"), None)
+        if existing is None and "uid" not in record:
+            if unmatched is None:
+                unmatched = _by_signature(registry.store, live.values())
+            candidates = unmatched.get(_signature(record))
+            if candidates:
+                existing = candidates.pop()
+                del live[existing.uid]
+
+        if existing is None:
+            create(record)
+            created += 1
+            continue
+
+        record_updated, record_moved = apply_record(registry.store, existing, record)
+        updated += record_updated
+        moved += record_moved
+
+    for removed in live.values():
+        destroy(removed)
+
+    return Changes(created, updated, moved, len(live))
+
+
+def apply_record(
+    store: frame_store.FrameStore, existing: frame.Frame, record: project_file.Record
+) -> typing.Tuple[bool, bool]:
+    return (
+        _apply_parameters(store, existing, record),
+        _apply_placement(store, existing, record),
+    )
+
+
+def _apply_parameters(
+    store: frame_store.FrameStore, existing: frame.Frame, record: project_file.Record
+):
+    display_klass = frame_display.get_klass(record["frame_type"])
+    if display_klass is existing.display_klass and not _differs(
+        store, existing.id, frame_store.FrameStore.PARAMETERS, record
+    ):
+        return False
+
+    existing.update(
+        record["stud_width"],
+        record["stud_height"],
+        record["length"],
+        record["height"],
+        display_klass,
+    )
+    return True
+
+
+def _apply_placement(
+    store: frame_store.FrameStore, existing: frame.Frame, record: project_file.Record
+):
+    moved = False
+    if _differs(store, existing.id, frame_store.FrameStore.POSITION, record):
+        existing.set_position(record["x"], record["y"], record["z"])
+        moved = True
+    if _differs(store, existing.id, frame_store.FrameStore.ROTATION, record):
+        existing.set_rotation(record["h"], record["p"], record["r"])
+        moved = True
+
+    return moved
+
+
+def _differs(
+    store: frame_store.FrameStore,
+    row: int,
+    columns: typing.Tuple[str, ...],
+    record: project_file.Record,
+):
+    return any(
+        not math.isclose(
+            getattr(store, column)[row], record[column], rel_tol=1e-6, abs_tol=1e-4
+        )
+        for column in columns
+    )
+
+
+def _signature(record: project_file.Record):
+    return (record["frame_type"],) + tuple(
+        round(record[column], 3) for column in frame_store.FrameStore.COLUMNS[1:]
+    )
+
+
+def _by_signature(
+    store: frame_store.FrameStore, frames: typing.Iterable[frame.Frame]
+) -> _Signatures:
+    result: _Signatures = defaultdict(list)
+    for candidate in frames:
+        result[_signature(store.record(candidate.id))].append(candidate)
+    return result
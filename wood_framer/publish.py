@@ -0,0 +1,73 @@
+import typing
+
+from direct.showbase.ShowBase import ShowBase
+from panda3d import bullet, core
+
+from . import (
+    frame_builder,
+    frame_display,
+    frame_registry,
+    frame_store,
+    geometry_cache,
+    project_file,
+)
+
+_METRES_TO_INCHES = 2.54
+
+_HEADLESS_CONFIG = """
+window-type none
+audio-library-name null
+"""
+
+
+def publish(project_path: str, output_path: str):
+    core.load_prc_file_data("", _HEADLESS_CONFIG)
+    base = ShowBase()
+    scene = compile_scene(base.loader, project_file.read(project_path))
+    scene.write_bam_file(core.Filename.from_os_specific(output_path))
+    base.destroy()
+
+
+def compile_scene(loader, records: typing.List[project_file.Record]) -> core.NodePath:
+    scene = core.NodePath("published")
+    scene.set_scale(_METRES_TO_INCHES)
+
+    builder = frame_builder.FrameBuilder(
+        loader,
+        core.NodePath("build"),
+        bullet.BulletWorld(),
+        frame_registry.FrameRegistry(frame_store.FrameStore()),
+    )
+    prototypes: typing.Dict[typing.Tuple, core.NodePath] = {}
+    layers: typing.Dict[str, core.NodePath] = {}
+
+    for record in records:
+        parameters = (
+            record["frame_type"],
+            record["stud_width"],
+            record["stud_height"],
+            record["length"],
+            record["height"],
+        )
+        prototype = prototypes.get(parameters)
+        if prototype is None:
+            built = builder.build(
+                *parameters[1:], frame_display.get_klass(record["frame_type"])
+            )
+            prototype = built.shared_geometry()
+            prototypes[parameters] = prototype
+            built.destroy()
+
+        layer = layers.get(record["frame_type"])
+        if layer is None:
+            layer = scene.attach_new_node(f"layer-{record['frame_type']}")
+            layers[record["frame_type"]] = layer
+
+        placement = layer.attach_new_node("frame")
+        placement.set_pos_hpr(
+            record["x"], record["y"], record["z"], record["h"], record["p"], record["r"]
+        )
+        prototype.instance_to(placement)
+
+    geometry_cache.strip_shaders(scene)
+    return scene
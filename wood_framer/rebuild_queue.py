@@ -0,0 +1,36 @@
+import collections
+import time
+import typing
+
+from direct.task import Task
+
+if typing.TYPE_CHECKING:
+    from . import frame
+
+
+class RebuildQueue:
+    def __init__(self, budget: float):
+        self._budget = budget
+        self._dirty: "collections.OrderedDict[frame.Frame, None]" = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self):
+        return len(self._dirty)
+
+    def mark(self, dirty_frame: "frame.Frame"):
+        self._dirty[dirty_frame] = None
+
+    def discard(self, clean_frame: "frame.Frame"):
+        self._dirty.pop(clean_frame, None)
+
+    def run(self, task: typing.Optional[Task.Task] = None):
+        deadline = time.perf_counter() + self._budget
+        while self._dirty:
+            dirty_frame, _ = self._dirty.popitem(last=False)
+            dirty_frame.rebuild()
+            if time.perf_counter() >= deadline:
+                break
+
+        if task is not None:
+            return task.cont
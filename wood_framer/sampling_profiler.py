@@ -0,0 +1,75 @@
+import os.path
+import sys
+import threading
+import time
+import types
+import typing
+from collections import Counter
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.005):
+        self._interval = interval
+        self._thread_id = threading.get_ident()
+        self._labels: typing.Dict[types.CodeType, str] = {}
+        self._stacks: typing.Counter[str] = Counter()
+        self._stopping = threading.Event()
+        self._sampler: typing.Optional[threading.Thread] = None
+        self._started = 0.0
+        self._duration = 0.0
+
+    @property
+    def running(self):
+        return self._sampler is not None
+
+    def start(self):
+        if self._sampler is not None:
+            return
+
+        self._stacks.clear()
+        self._stopping.clear()
+        self._started = time.perf_counter()
+        self._sampler = threading.Thread(
+            target=self._sample, name="sampling_profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self):
+        if self._sampler is None:
+            return
+
+        self._stopping.set()
+        self._sampler.join()
+        self._sampler = None
+        self._duration = time.perf_counter() - self._started
+
+    def write(self, path: str, tags: typing.Dict[str, typing.Any]):
+        root = " ".join(
+            ["wood_framer"]
+            + [f"{name}={value}" for name, value in tags.items()]
+            + [f"seconds={self._duration:.1f}"]
+        )
+        with open(path, "w+") as file:
+            for stack, count in self._stacks.most_common():
+                file.write(f"{root};{stack} {count}\n")
+
+    def _sample(self):
+        while not self._stopping.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            labels: typing.List[str] = []
+            while frame is not None:
+                labels.append(self._label(frame.f_code))
+                frame = frame.f_back
+
+            if labels:
+                self._stacks[";".join(reversed(labels))] += 1
+
+    def _label(self, code: types.CodeType):
+        label = self._labels.get(code)
+        if label is None:
+            label = (
+                f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                f":{code.co_firstlineno})"
+            )
+            self._labels[code] = label
+        return label
@@ -0,0 +1,42 @@
+import concurrent.futures
+import functools
+import queue
+import threading
+import typing
+
+from direct.task import Task
+
+_Callable = typing.TypeVar("_Callable", bound=typing.Callable[..., typing.Any])
+
+Mutation = typing.Tuple[concurrent.futures.Future, typing.Callable[[], typing.Any]]
+
+_pending: "queue.SimpleQueue[Mutation]" = queue.SimpleQueue()
+
+
+def mutates_scene(method: _Callable) -> _Callable:
+    @functools.wraps(method)
+    def _synchronized(*args, **kwargs):
+        if threading.current_thread() is threading.main_thread():
+            return method(*args, **kwargs)
+
+        result: concurrent.futures.Future = concurrent.futures.Future()
+        _pending.put((result, functools.partial(method, *args, **kwargs)))
+        return result.result()
+
+    return typing.cast(_Callable, _synchronized)
+
+
+def flush(task: typing.Optional[Task.Task] = None):
+    while True:
+        try:
+            result, mutation = _pending.get_nowait()
+        except queue.Empty:
+            break
+
+        try:
+            result.set_result(mutation())
+        except BaseException as error:
+            result.set_exception(error)
+
+    if task is not None:
+        return task.cont
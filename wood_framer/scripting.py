@@ -0,0 +1,142 @@
+import code
+import typing
+
+from . import (
+    frame,
+    frame_registry,
+    frame_store,
+    project_file,
+    project_watcher,
+    scene_sync,
+)
+
+_FIELDS = ("frame_type",) + frame_store.FrameStore.COLUMNS[1:]
+
+
+class FrameEdit:
+    __slots__ = ("_frame", "_record", "_changed")
+
+    def __init__(self, frame_to_edit: frame.Frame, record: project_file.Record):
+        object.__setattr__(self, "_frame", frame_to_edit)
+        object.__setattr__(self, "_record", record)
+        object.__setattr__(self, "_changed", False)
+
+    @property
+    def frame(self):
+        return self._frame
+
+    @property
+    def record(self):
+        return self._record
+
+    @property
+    def changed(self):
+        return self._changed
+
+    def __getattr__(self, name: str):
+        try:
+            return self._record[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: typing.Any):
+        if name not in _FIELDS:
+            raise AttributeError(name)
+
+        self._record[name] = value
+        object.__setattr__(self, "_changed", True)
+
+
+class Transaction:
+    def __init__(
+        self,
+        registry: frame_registry.FrameRegistry,
+        create: typing.Callable[[typing.List[project_file.Record]], typing.Any],
+        destroy: typing.Callable[[frame.Frame], None],
+    ):
+        self._registry = registry
+        self._create = create
+        self._destroy = destroy
+        self._edits: typing.Dict[int, FrameEdit] = {}
+        self._created: typing.List[project_file.Record] = []
+        self._deleted: typing.Dict[int, frame.Frame] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, error_type, error, traceback):
+        if error_type is None:
+            self.commit()
+
+    def __iter__(self) -> typing.Iterator[FrameEdit]:
+        return iter(self._edit_all(self._registry))
+
+    def edit(self, frame_to_edit: frame.Frame) -> FrameEdit:
+        result = self._edits.get(frame_to_edit.id)
+        if result is None:
+            result = FrameEdit(
+                frame_to_edit, self._registry.store.record(frame_to_edit.id)
+            )
+            self._edits[frame_to_edit.id] = result
+        return result
+
+    def by_type(self, serialized_name: str) -> typing.List[FrameEdit]:
+        return self._edit_all(self._registry.by_type(serialized_name))
+
+    def by_lumber(
+        self, stud_width: float, stud_height: float
+    ) -> typing.List[FrameEdit]:
+        return self._edit_all(self._registry.by_lumber(stud_width, stud_height))
+
+    def add(self, frame_type: str, **record: typing.Any) -> project_file.Record:
+        new_record: project_file.Record = {field: 0 for field in _FIELDS[1:]}
+        new_record.update(record, frame_type=frame_type)
+        self._created.append(new_record)
+        return new_record
+
+    def delete(self, frame_to_delete: typing.Union[FrameEdit, frame.Frame]):
+        deleted = (
+            frame_to_delete.frame
+            if isinstance(frame_to_delete, FrameEdit)
+            else frame_to_delete
+        )
+        self._deleted[deleted.id] = deleted
+
+    @scene_sync.mutates_scene
+    def commit(self) -> project_watcher.Changes:
+        store = self._registry.store
+        updated = moved = 0
+
+        for frame_to_delete in self._deleted.values():
+            self._destroy(frame_to_delete)
+
+        for frame_id, frame_edit in self._edits.items():
+            if frame_id in self._deleted or not frame_edit.changed:
+                continue
+
+            frame_updated, frame_moved = project_watcher.apply_record(
+                store, frame_edit.frame, frame_edit.record
+            )
+            updated += frame_updated
+            moved += frame_moved
+
+        if self._created:
+            self._create(list(self._created))
+
+        changes = project_watcher.Changes(
+            len(self._created), updated, moved, len(self._deleted)
+        )
+        self._edits.clear()
+        self._created.clear()
+        self._deleted.clear()
+        return changes
+
+    def _edit_all(self, frames: typing.Iterable[frame.Frame]) -> typing.List[FrameEdit]:
+        return [self.edit(frame_to_edit) for frame_to_edit in frames]
+
+
+class Console(code.InteractiveConsole):
+    def run_file(self, path: str):
+        with open(path, "r") as file:
+            source = file.read()
+        self.runcode(compile(source, path, "exec"))
@@ -0,0 +1,120 @@
+import bisect
+import typing
+from collections import Counter
+
+SHEET_WIDTH = 48
+SHEET_HEIGHT = 96
+SHEET_THICKNESS = 1 / 2
+SHEET_NAME = "4'x8' ply wood"
+
+_SEARCH_LIMIT = 1024
+
+Panel = typing.Tuple[float, float, float, float]
+Placement = typing.Tuple[float, float, float, float]
+_Space = typing.Tuple[float, float, float, float]
+_Size = typing.Tuple[float, float, float]
+
+_SHEET_SIZE: _Size = (SHEET_WIDTH * SHEET_HEIGHT, SHEET_WIDTH, SHEET_HEIGHT)
+
+
+def panels(length: float, height: float) -> typing.List[Panel]:
+    result: typing.List[Panel] = []
+
+    x = 0.0
+    while x < length:
+        width = min(SHEET_WIDTH, length - x)
+        z = 0.0
+        while z < height:
+            panel_height = min(SHEET_HEIGHT, height - z)
+            result.append((x, z, width, panel_height))
+            z += panel_height
+        x += width
+
+    return result
+
+
+def nest(
+    pieces: typing.Iterable[typing.Tuple[float, float]],
+) -> typing.List[typing.List[Placement]]:
+    sheets: typing.List[typing.List[Placement]] = []
+    spaces: typing.Dict[_Size, typing.List[typing.Tuple[int, float, float]]] = {}
+    sizes: typing.List[_Size] = []
+
+    def add_space(sheet_index: int, x: float, y: float, width: float, height: float):
+        size = (width * height, width, height)
+        same_size = spaces.get(size)
+        if same_size is None:
+            same_size = spaces[size] = []
+            bisect.insort(sizes, size)
+        same_size.append((sheet_index, x, y))
+
+    for (width, height), count in sorted(
+        Counter(pieces).items(),
+        key=lambda size: (max(size[0]), min(size[0])),
+        reverse=True,
+    ):
+        if sorted((width, height)) == [SHEET_WIDTH, SHEET_HEIGHT]:
+            sheets += [[(0, 0, SHEET_WIDTH, SHEET_HEIGHT)] for _ in range(count)]
+            continue
+
+        for _ in range(count):
+            best: typing.Optional[typing.Tuple[_Size, bool]] = None
+            first = bisect.bisect_left(sizes, (width * height,))
+            for size in sizes[first : first + _SEARCH_LIMIT]:
+                _, space_width, space_height = size
+                if width <= space_width and height <= space_height:
+                    best = (size, False)
+                elif height <= space_width and width <= space_height:
+                    best = (size, True)
+                if best is not None:
+                    break
+
+            if best is None:
+                sheets.append([])
+                add_space(len(sheets) - 1, 0, 0, SHEET_WIDTH, SHEET_HEIGHT)
+                best = (_SHEET_SIZE, width > SHEET_WIDTH)
+
+            size, rotated = best
+            _, space_width, space_height = size
+            placed_width, placed_height = (
+                (height, width) if rotated else (width, height)
+            )
+
+            same_size = spaces[size]
+            sheet_index, x, y = same_size.pop()
+            if not same_size:
+                del spaces[size]
+                del sizes[bisect.bisect_left(sizes, size)]
+
+            sheets[sheet_index].append((x, y, placed_width, placed_height))
+            for split in _split(
+                x, y, space_width, space_height, placed_width, placed_height
+            ):
+                add_space(sheet_index, *split)
+
+    return sheets
+
+
+def sheet_count(pieces: typing.Iterable[typing.Tuple[float, float]]):
+    return len(nest(pieces))
+
+
+def _split(
+    x: float,
+    y: float,
+    space_width: float,
+    space_height: float,
+    width: float,
+    height: float,
+) -> typing.List[_Space]:
+    right_width = space_width - width
+    top_height = space_height - height
+
+    if right_width * space_height > top_height * space_width:
+        right = (x + width, y, right_width, space_height)
+        top = (x, y + height, width, top_height)
+    else:
+        right = (x + width, y, right_width, height)
+        top = (x, y + height, space_width, top_height)
+
+    return [space for space in (right, top) if space[2] > 0 and space[3] > 0]
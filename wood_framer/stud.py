@@ -62,9 +62,9 @@ def length_message(stud_width: float, stud_height: float, inches: float):
 
 def inches_to_nice_length(inches: float):
     feet = 0
-    while inches >= INCHES_TO_FEET:
-        feet += 1
-        inches -= INCHES_TO_FEET
+    if inches >= INCHES_TO_FEET:
+        whole_feet, inches = divmod(inches, INCHES_TO_FEET)
+        feet = int(whole_feet)
     message = ""
     if feet > 0:
         message += f"{feet}'"
@@ -0,0 +1,149 @@
+import concurrent.futures
+import os
+import os.path
+import typing
+
+from direct.showbase.ShowBase import ShowBase
+from panda3d import bullet, core
+
+from . import frame, frame_builder, frame_registry, frame_store, project_file
+
+VIEWS = ("isometric", "elevations")
+
+_OFFSCREEN_CONFIG = """
+window-type offscreen
+load-display p3tinydisplay
+aux-display p3tinydisplay
+audio-library-name null
+"""
+
+_renderer: typing.Optional["ThumbnailRenderer"] = None
+
+
+class ThumbnailRenderer(ShowBase):
+    _METRES_TO_INCHES = 2.54
+    _MARGIN = 1.1
+    _ISOMETRIC_DIRECTION = core.Vec3(1, -1, 1).normalized()
+
+    def __init__(self):
+        super().__init__(windowType="offscreen")
+
+        light = core.DirectionalLight("light")
+        light_node_path = self.render.attach_new_node(light)
+        light_node_path.set_hpr(30, -60, 0)
+        self.render.set_light(light_node_path)
+
+        main_light = core.AmbientLight("light2")
+        main_light.set_color(core.Vec4(0.5, 0.5, 0.5, 1))
+        light_node_path = self.render.attach_new_node(main_light)
+        self.render.set_light(light_node_path)
+
+        self._scene: core.NodePath = self.render.attach_new_node("scene")
+        self._scene.set_scale(self._METRES_TO_INCHES)
+        self._scene.set_shader_off(1)
+
+        self._frame_registry = frame_registry.FrameRegistry(frame_store.FrameStore())
+        self._frame_builder = frame_builder.FrameBuilder(
+            self.loader, self._scene, bullet.BulletWorld(), self._frame_registry
+        )
+
+        self._lens = core.OrthographicLens()
+        self.cam.node().set_lens(self._lens)
+        self.set_background_color(1, 1, 1, 1)
+
+    def render_project(
+        self, path: str, output_directory: str, views: typing.Sequence[str]
+    ) -> typing.List[str]:
+        for old_frame in self._frame_registry:
+            old_frame.destroy()
+        for details in project_file.read(path):
+            self._frame_builder.build_from_record(details)
+
+        os.makedirs(output_directory, exist_ok=True)
+        name = os.path.splitext(os.path.basename(path))[0]
+        outputs: typing.List[str] = []
+
+        if "isometric" in views and len(self._frame_registry) > 0:
+            self._frame_isometric()
+            outputs.append(
+                self._save(os.path.join(output_directory, f"{name}-isometric.png"))
+            )
+
+        if "elevations" in views:
+            for index, frame_to_render in enumerate(self._frame_registry):
+                self._frame_elevation(frame_to_render)
+                outputs.append(
+                    self._save(
+                        os.path.join(output_directory, f"{name}-elevation-{index}.png")
+                    )
+                )
+
+        return outputs
+
+    def _frame_isometric(self):
+        bounds_min, bounds_max = self._scene.get_tight_bounds(self.render)
+        centre = (bounds_min + bounds_max) / 2
+        radius = (bounds_max - bounds_min).length() / 2
+
+        self.camera.set_pos(centre + self._ISOMETRIC_DIRECTION * radius * 4)
+        self.camera.look_at(centre)
+        self._fit(radius * 2, radius * 2)
+
+    def _frame_elevation(self, frame_to_render: frame.Frame):
+        placement = self._scene.attach_new_node("elevation")
+        placement.set_pos(frame_to_render.get_position())
+        placement.set_hpr(frame_to_render.get_rotation())
+
+        centre = core.Point3(frame_to_render.length / 2, 0, frame_to_render.height / 2)
+        distance = max(frame_to_render.length, frame_to_render.height) * 4
+        self.camera.set_pos(placement, centre + core.Vec3(0, distance, 0))
+        self.camera.look_at(placement, centre, core.Vec3(0, 0, 1))
+        placement.remove_node()
+
+        self._fit(
+            frame_to_render.length * self._METRES_TO_INCHES,
+            frame_to_render.height * self._METRES_TO_INCHES,
+        )
+
+    def _fit(self, width: float, height: float):
+        aspect_ratio = self.get_aspect_ratio()
+        width = max(width, height * aspect_ratio) * self._MARGIN
+        self._lens.set_film_size(width, width / aspect_ratio)
+        self._lens.set_near_far(1, width * 100)
+
+    def _save(self, path: str):
+        self.graphicsEngine.render_frame()
+        self.graphicsEngine.render_frame()
+        self.win.save_screenshot(core.Filename.from_os_specific(path))
+        return path
+
+
+def render_projects(
+    paths: typing.List[str],
+    output_directory: str,
+    views: typing.Sequence[str] = VIEWS,
+    size: typing.Tuple[int, int] = (800, 600),
+    jobs: typing.Optional[int] = None,
+) -> typing.List[str]:
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=_start_renderer, initargs=size
+    ) as executor:
+        results = executor.map(
+            _render_project,
+            paths,
+            [output_directory] * len(paths),
+            [views] * len(paths),
+        )
+        return [output for outputs in results for output in outputs]
+
+
+def _start_renderer(width: int, height: int):
+    global _renderer
+
+    core.load_prc_file_data("", f"{_OFFSCREEN_CONFIG}\nwin-size {width} {height}")
+    _renderer = ThumbnailRenderer()
+
+
+def _render_project(path: str, output_directory: str, views: typing.Sequence[str]):
+    assert _renderer is not None
+    return _renderer.render_project(path, output_directory, views)
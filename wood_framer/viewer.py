@@ -0,0 +1,47 @@
+from direct.showbase.ShowBase import ShowBase
+from panda3d import core
+
+
+class Viewer(ShowBase):
+    _VIEW_DIRECTION = core.Vec3(1, -1, 0.5).normalized()
+
+    def __init__(self, scene_path: str):
+        super().__init__()
+
+        light = core.DirectionalLight("light")
+        light_node_path = self.render.attach_new_node(light)
+        light_node_path.set_hpr(30, -60, 0)
+        self.render.set_light(light_node_path)
+
+        main_light = core.AmbientLight("light2")
+        main_light.set_color(core.Vec4(0.5, 0.5, 0.5, 1))
+        light_node_path = self.render.attach_new_node(main_light)
+        self.render.set_light(light_node_path)
+
+        self._scene: core.NodePath = self.loader.load_model(
+            core.Filename.from_os_specific(scene_path), noCache=True
+        )
+        self._scene.reparent_to(self.render)
+        self._frame_scene()
+
+    def _frame_scene(self):
+        bounds = self._scene.get_tight_bounds(self.render)
+        if bounds is None:
+            return
+
+        bounds_min, bounds_max = bounds
+        centre = (bounds_min + bounds_max) / 2
+        radius = max((bounds_max - bounds_min).length() / 2, 1)
+
+        self.disable_mouse()
+        self.camera.set_pos(centre + self._VIEW_DIRECTION * radius * 2.5)
+        self.camera.look_at(centre)
+        self.camLens.set_near_far(radius / 100, radius * 10)
+        camera_transform = core.Mat4(self.camera.get_mat())
+        camera_transform.invert_in_place()
+        self.mouseInterfaceNode.set_mat(camera_transform)
+        self.enable_mouse()
+
+
+def view(scene_path: str):
+    Viewer(scene_path).run()
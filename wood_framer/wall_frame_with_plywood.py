@@ -2,7 +2,38 @@ import typing
 
 from panda3d import core
 
-from . import frame_display, wall_frame
+from . import frame_display, sheet_goods, wall_frame
+
+_PANEL_FACES = ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1))
+
+
+def make_panel(parent: core.NodePath) -> core.NodePath:
+    vertex_data = core.GeomVertexData(
+        "panel", core.GeomVertexFormat.get_v3n3t2(), core.Geom.UH_static
+    )
+    vertices = core.GeomVertexWriter(vertex_data, "vertex")
+    normals = core.GeomVertexWriter(vertex_data, "normal")
+    texcoords = core.GeomVertexWriter(vertex_data, "texcoord")
+    triangles = core.GeomTriangles(core.Geom.UH_static)
+
+    for face_index, (x, y, z) in enumerate(_PANEL_FACES):
+        normal = core.Vec3(x, y, z)
+        across = core.Vec3(y, z, x)
+        up = normal.cross(across)
+        for u, v in ((0, 0), (1, 0), (1, 1), (0, 1)):
+            vertices.add_data3((normal + across * (u * 2 - 1) + up * (v * 2 - 1)) / 2)
+            normals.add_data3(normal)
+            texcoords.add_data2(u, v)
+
+        first = face_index * 4
+        triangles.add_vertices(first, first + 1, first + 2)
+        triangles.add_vertices(first, first + 2, first + 3)
+
+    geom = core.Geom(vertex_data)
+    geom.add_primitive(triangles)
+    geom_node = core.GeomNode("panel")
+    geom_node.add_geom(geom)
+    return parent.attach_new_node(geom_node)
 
 
 class Display(wall_frame.Display):
@@ -21,11 +52,24 @@ class Display(wall_frame.Display):
             display_parent, stud_width, stud_height, length, height, make_stud
         )
 
-        outside_board = make_stud(self._frame, length, 1 / 2, height)
-        outside_board.set_x(length / 2)
-        outside_board.set_y(-(self._stud_height / 2 + 1 / 4))
-        outside_board.set_transparency(True)
-        outside_board.set_alpha_scale(0.75)
+        for x, z, panel_width, panel_height in self.sheathing(
+            stud_width, stud_height, length, height
+        ):
+            panel = make_panel(self._frame)
+            panel.set_pos(
+                x + panel_width / 2,
+                -(self._stud_height / 2 + sheet_goods.SHEET_THICKNESS / 2),
+                z + panel_height / 2,
+            )
+            panel.set_scale(panel_width, sheet_goods.SHEET_THICKNESS, panel_height)
+            panel.set_transparency(True)
+            panel.set_alpha_scale(0.75)
+
+    @classmethod
+    def sheathing(
+        cls, stud_width: float, stud_height: float, length: float, height: float
+    ) -> typing.List[sheet_goods.Panel]:
+        return sheet_goods.panels(length, height)
 
     @staticmethod
     def create(